@@ -0,0 +1,46 @@
+"""
+Compare `DateTimeSerializer.load_many` with the lenient regex parser, on strings written by
+`datetime.isoformat`.
+"""
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from sample_data import report
+
+from serialchemy.datetime_serializer import DateSerializer
+from serialchemy.datetime_serializer import DateTimeSerializer
+
+VALUES_COUNT = 100000
+
+
+def main():
+    start = datetime(2000, 1, 1, tzinfo=timezone(timedelta(hours=-3)))
+    values = [(start + timedelta(seconds=7 * i)).isoformat() for i in range(VALUES_COUNT)]
+    naive_values = [value[:-6] for value in values]
+    date_values = [value[:10] for value in values]
+    assert DateTimeSerializer.load_many(values) == [
+        DateTimeSerializer._load_lenient(value) for value in values
+    ]
+
+    for name, serialized_values in (('with offset', values), ('naive', naive_values)):
+        print(f'DateTimeSerializer, {VALUES_COUNT} values {name}')
+        baseline = report(
+            '  regex',
+            lambda: [DateTimeSerializer._load_lenient(value) for value in serialized_values],
+        )
+        best = report('  load_many', lambda: DateTimeSerializer.load_many(serialized_values))
+        print(f'  speedup: {baseline / best:.2f}x')
+
+    print(f'DateSerializer, {VALUES_COUNT} values')
+    baseline = report(
+        '  regex',
+        lambda: [DateTimeSerializer._load_lenient(value).date() for value in date_values],
+    )
+    best = report('  load_many', lambda: DateSerializer.load_many(date_values))
+    print(f'  speedup: {baseline / best:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
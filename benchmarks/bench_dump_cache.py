@@ -0,0 +1,46 @@
+"""
+Compare `dump_many` of employees (nesting their company and contacts) without a cache and with
+a warm `DumpCache`.
+"""
+
+from sample_data import create_session
+from sample_data import report
+from sample_data import seed_employees
+
+from serialchemy import DumpCache
+from serialchemy import ModelSerializer
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy._tests.sample_model import Company
+from serialchemy._tests.sample_model import Contact
+from serialchemy._tests.sample_model import Employee
+
+EMPLOYEES_COUNT = 5000
+
+
+class EmployeeSerializer(ModelSerializer):
+    company = NestedModelField(Company)
+    contacts = NestedModelListField(Contact)
+
+
+def main():
+    session = create_session()
+    seed_employees(session, EMPLOYEES_COUNT)
+    serializer = EmployeeSerializer(Employee)
+    cache = DumpCache(maxsize=EMPLOYEES_COUNT)
+    cached_serializer = EmployeeSerializer(Employee, dump_cache=cache)
+    employees = session.query(Employee).options(*serializer.loader_options()).all()
+
+    print(f'dump_many, {EMPLOYEES_COUNT} employees')
+    baseline = report('  without cache', lambda: serializer.dump_many(employees))
+    best = report(
+        '  cold DumpCache', lambda: (cache.clear(), cached_serializer.dump_many(employees))
+    )
+    print(f'  speedup: {baseline / best:.2f}x')
+    best = report('  warm DumpCache', lambda: cached_serializer.dump_many(employees))
+    print(f'  speedup: {baseline / best:.2f}x')
+    print(f'  {cache.cache_info()}')
+
+
+if __name__ == '__main__':
+    main()
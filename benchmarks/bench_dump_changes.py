@@ -0,0 +1,64 @@
+"""
+Compare `dump_changes` with a full `dump` of edited employees followed by a diff against the
+previous dump, in time and size of the JSON encoded output.
+"""
+
+import json
+
+from sample_data import create_session
+from sample_data import report
+from sample_data import seed_employees
+
+from serialchemy import ModelSerializer
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy._tests.sample_model import Address
+from serialchemy._tests.sample_model import Contact
+from serialchemy._tests.sample_model import Employee
+
+EMPLOYEES_COUNT = 5000
+
+
+class EmployeeSerializer(ModelSerializer):
+    address = NestedModelField(Address)
+    contacts = NestedModelListField(Contact)
+
+
+def diff(previous, current):
+    return {name: value for name, value in current.items() if previous.get(name) != value}
+
+
+def main():
+    session = create_session()
+    seed_employees(session, EMPLOYEES_COUNT)
+    serializer = EmployeeSerializer(Employee)
+    employees = session.query(Employee).options(*serializer.loader_options()).all()
+    previous = serializer.dump_many(employees)
+
+    # A typical edit: a column and an attribute of a nested model
+    for employee in employees:
+        employee.email = f'new.{employee.email}'
+        employee.address.city = 'Mar Sara'
+
+    def dump_and_diff():
+        return [diff(*items) for items in zip(previous, serializer.dump_many(employees))]
+
+    def dump_changes():
+        return [serializer.dump_changes(employee) for employee in employees]
+
+    print(f'{EMPLOYEES_COUNT} edited employees')
+    baseline = report('  dump_many + diff', dump_and_diff)
+    best = report('  dump_changes', dump_changes)
+    print(f'  speedup: {baseline / best:.2f}x')
+
+    print('JSON size')
+    full_size = len(json.dumps(serializer.dump_many(employees)))
+    diff_size = len(json.dumps(dump_and_diff()))
+    changes_size = len(json.dumps(dump_changes()))
+    print(f'  dump_many: {full_size} bytes')
+    print(f'  dump_many + diff: {diff_size} bytes')
+    print(f'  dump_changes: {changes_size} bytes ({changes_size / full_size:.0%} of dump_many)')
+
+
+if __name__ == '__main__':
+    main()
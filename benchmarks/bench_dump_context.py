@@ -0,0 +1,56 @@
+"""
+Compare `dump_many` of employees nesting their (shared) company and contact types with and
+without a `DumpContext`, in time and size of the JSON encoded output.
+"""
+
+import json
+
+from sample_data import create_session
+from sample_data import report
+from sample_data import seed_employees
+
+from serialchemy import ModelSerializer
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy._tests.sample_model import Company
+from serialchemy._tests.sample_model import Contact
+from serialchemy._tests.sample_model import ContactType
+from serialchemy._tests.sample_model import Employee
+from serialchemy.dump_context import DumpContext
+
+EMPLOYEES_COUNT = 5000
+
+
+class ContactSerializer(ModelSerializer):
+    type = NestedModelField(ContactType)
+
+
+class EmployeeSerializer(ModelSerializer):
+    company = NestedModelField(Company)
+    contacts = NestedModelListField(Contact, serializer=ContactSerializer(Contact))
+
+
+def main():
+    session = create_session()
+    seed_employees(session, EMPLOYEES_COUNT)
+    serializer = EmployeeSerializer(Employee)
+    employees = session.query(Employee).options(*serializer.loader_options()).all()
+
+    print(f'dump_many, {EMPLOYEES_COUNT} employees')
+    baseline = report('  without context', lambda: serializer.dump_many(employees))
+    for name, create_context in (
+        ('  DumpContext()', DumpContext),
+        ('  DumpContext(refs=True)', lambda: DumpContext(refs=True)),
+    ):
+        best = report(name, lambda: serializer.dump_many(employees, context=create_context()))
+        print(f'  speedup: {baseline / best:.2f}x')
+
+    print('JSON size')
+    baseline_size = len(json.dumps(serializer.dump_many(employees)))
+    print(f'  without context: {baseline_size} bytes')
+    size = len(json.dumps(serializer.dump_many(employees, context=DumpContext(refs=True))))
+    print(f'  DumpContext(refs=True): {size} bytes ({size / baseline_size:.0%})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Compare `ModelSerializer.dump_json_many` with `json.dumps` over the output of `dump_many`.
+"""
+
+import json
+
+from sample_data import create_session
+from sample_data import report
+from sample_data import seed_employees
+
+from serialchemy._tests.sample_model import Employee
+from serialchemy._tests.sample_model import EmployeeSerializer
+
+EMPLOYEES_COUNT = 10000
+
+
+def main():
+    session = create_session()
+    seed_employees(session, EMPLOYEES_COUNT)
+    employees = session.query(Employee).all()
+    for employee in employees:
+        # Load relationships beforehand, so only serialization is measured
+        employee.address, employee.contacts
+
+    serializer = EmployeeSerializer(Employee)
+    print(f'EmployeeSerializer, {EMPLOYEES_COUNT} employees')
+    baseline = report(
+        '  json.dumps(serializer.dump_many(employees))',
+        lambda: json.dumps(serializer.dump_many(employees), separators=(',', ':')).encode(),
+    )
+    best = report(
+        '  serializer.dump_json_many(employees)', lambda: serializer.dump_json_many(employees)
+    )
+    print(f'  speedup: {baseline / best:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare `ModelSerializer.dump_many` with a list comprehension calling `dump` for each model.
+"""
+
+from sample_data import create_session
+from sample_data import report
+from sample_data import seed_employees
+
+from serialchemy import PolymorphicModelSerializer
+from serialchemy._tests.sample_model import Employee
+from serialchemy._tests.sample_model import EmployeeSerializer
+
+EMPLOYEES_COUNT = 10000
+
+
+def main():
+    session = create_session()
+    seed_employees(session, EMPLOYEES_COUNT)
+    employees = session.query(Employee).all()
+    for employee in employees:
+        # Load relationships beforehand, so only serialization is measured
+        employee.address, employee.contacts
+
+    for serializer in [
+        EmployeeSerializer(Employee),
+        EmployeeSerializer(Employee, compiled=True),
+        PolymorphicModelSerializer(Employee),
+    ]:
+        name = type(serializer).__name__ + (' (compiled)' if serializer.compiled else '')
+        print(f'{name}, {EMPLOYEES_COUNT} employees')
+        baseline = report(
+            '  [serializer.dump(e) for e in employees]',
+            lambda: [serializer.dump(e) for e in employees],
+        )
+        best = report('  serializer.dump_many(employees)', lambda: serializer.dump_many(employees))
+        print(f'  speedup: {baseline / best:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Compare `ModelSerializer.dump_rows` with `dump_parallel` on an increasing number of processes.
+"""
+
+import os
+
+from sample_data import create_session
+from sample_data import report
+from sample_data import seed_employees
+
+from serialchemy._tests.sample_model import Employee
+from serialchemy._tests.sample_model import EmployeeSerializer
+
+EMPLOYEES_COUNT = 10000
+ROWS_REPEAT = 50
+CHUNK_SIZE = 20000
+
+
+def main():
+    session = create_session()
+    seed_employees(session, EMPLOYEES_COUNT, contacts_per_employee=0)
+    serializer = EmployeeSerializer(Employee)
+    # Fetch rows beforehand (as tuples, the form sent to worker processes), so only the dump is
+    # measured
+    rows = [tuple(row) for row in session.execute(serializer.row_select())] * ROWS_REPEAT
+
+    print(f'EmployeeSerializer, {len(rows)} rows')
+    baseline = report('  dump_rows', lambda: serializer.dump_rows(rows), number=3)
+    workers = 1
+    while workers <= os.cpu_count():
+        best = report(
+            f'  dump_parallel, {workers} workers',
+            lambda: serializer.dump_parallel(rows, workers=workers, chunk_size=CHUNK_SIZE),
+            number=3,
+        )
+        print(f'  speedup: {baseline / best:.2f}x')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
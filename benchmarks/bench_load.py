@@ -0,0 +1,85 @@
+"""
+Compare `load` using the precompiled load plan with the previous implementation, which resolved
+each field and its kind (session based, creation only, constructor argument) for every loaded
+value.
+"""
+
+import warnings
+
+from sample_data import report
+
+from serialchemy import EnumKeyField
+from serialchemy import Field
+from serialchemy import ModelSerializer
+from serialchemy import NestedModelField
+from serialchemy._tests.sample_model import Address
+from serialchemy._tests.sample_model import Employee
+from serialchemy._tests.sample_model import MaritalStatus
+
+EMPLOYEES_COUNT = 20000
+
+
+class EmployeeSerializer(ModelSerializer):
+    created_at = Field(dump_only=True)
+    address = NestedModelField(Address)
+    marital_status = EnumKeyField(MaritalStatus)
+
+
+class PreviousEmployeeSerializer(EmployeeSerializer):
+    def load(self, serialized, existing_model=None, session=None):
+        from serialchemy.nested_fields import SessionBasedField
+
+        prepared_attrs = {}
+        fields = self._plan.by_name
+        for field_name, value in serialized.items():
+            spec = fields.get(field_name)
+            if spec is None:
+                warnings.warn(f"Field '{field_name}' not defined for {self._model_class.__name__}")
+                continue
+            field = spec.field
+            if field.dump_only:
+                continue
+            if field.creation_only and existing_model:
+                continue
+            if isinstance(field, SessionBasedField):
+                deserialized = field.load(value, session=session)
+            else:
+                deserialized = field.load(value)
+            prepared_attrs[field_name] = deserialized
+        model = self._create_model(prepared_attrs)
+        for key, value in prepared_attrs.items():
+            if key in self.model_class_parameters:
+                continue
+            setattr(model, key, value)
+        return model
+
+
+def main():
+    serialized_items = [
+        {
+            'id': i,
+            'firstname': f'First {i}',
+            'lastname': 'Last',
+            'email': f'employee{i}@email.com',
+            'role': 'Employee',
+            'admission': '2152-01-02T00:00:00',
+            'marital_status': 'MARRIED',
+            'created_at': '2152-01-02T00:00:00',
+            'address': {'street': '5 Av', 'number': '943', 'city': 'Tarsonis', 'state': 'NA'},
+        }
+        for i in range(EMPLOYEES_COUNT)
+    ]
+    previous = PreviousEmployeeSerializer(Employee)
+    serializer = EmployeeSerializer(Employee)
+    assert [previous.dump(model) for model in previous.load_many(serialized_items[:10])] == [
+        serializer.dump(model) for model in serializer.load_many(serialized_items[:10])
+    ]
+
+    print(f'ModelSerializer, {EMPLOYEES_COUNT} employees')
+    baseline = report('  previous load_many', lambda: previous.load_many(serialized_items))
+    best = report('  load_many', lambda: serializer.load_many(serialized_items))
+    print(f'  speedup: {baseline / best:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
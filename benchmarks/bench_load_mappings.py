@@ -0,0 +1,51 @@
+"""
+Compare inserting serialized companies as models (`load_many` then `add_all` and `flush`) with
+`load_many(..., mode='mappings')` and `bulk_insert_mappings` or a Core executemany insert.
+"""
+
+from sample_data import create_session
+from sample_data import report
+from sqlalchemy import insert
+
+from serialchemy import ModelSerializer
+from serialchemy._tests.sample_model import Company
+
+COMPANIES_COUNT = 20000
+
+
+def main():
+    session = create_session()
+    serializer = ModelSerializer(Company)
+    serialized_items = [
+        {'id': i, 'name': f'Company {i}', 'location': f'Location {i}'}
+        for i in range(1, COMPANIES_COUNT + 1)
+    ]
+
+    def insert_models():
+        session.add_all(serializer.load_many(serialized_items))
+        session.flush()
+        session.rollback()
+
+    def insert_mappings():
+        session.bulk_insert_mappings(
+            Company, serializer.load_many(serialized_items, mode='mappings')
+        )
+        session.rollback()
+
+    def insert_core():
+        mappings = serializer.load_many(serialized_items, mode='mappings')
+        session.execute(insert(Company.__table__), mappings)
+        session.rollback()
+
+    print(f'ModelSerializer, {COMPANIES_COUNT} companies')
+    baseline = report('  load_many + add_all + flush', insert_models)
+    for name, function in (
+        ('  mappings + bulk_insert_mappings', insert_mappings),
+        ('  mappings + Core insert', insert_core),
+    ):
+        best = report(name, function)
+        print(f'  speedup: {baseline / best:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
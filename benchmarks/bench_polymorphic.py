@@ -0,0 +1,73 @@
+"""
+Measure `PolymorphicModelSerializer` on a deep and wide (single table) inheritance tree: creation
+of the serializer and dump of models of every class in the tree.
+"""
+
+from sample_data import report
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.orm import declarative_base
+
+from serialchemy import PolymorphicModelSerializer
+
+DEPTH = 4
+WIDTH = 4
+MODELS_COUNT = 100000
+
+
+def create_tree():
+    """
+    Create a base class with `WIDTH` subclasses, each with `WIDTH` subclasses and so on, down to
+    `DEPTH` levels.
+
+    :return: the base class and all mapped classes
+    """
+    Base = declarative_base()
+
+    class Node(Base):
+        __tablename__ = 'Node'
+        id = Column(Integer, primary_key=True)
+        kind = Column(String)
+        name = Column(String)
+        value = Column(Integer)
+        __mapper_args__ = {'polymorphic_on': kind, 'polymorphic_identity': 'Node'}
+
+    classes = [Node]
+    level = [Node]
+    for depth in range(DEPTH):
+        next_level = []
+        for parent in level:
+            for index in range(WIDTH):
+                name = f'{parent.__name__}_{index}'
+                next_level.append(
+                    type(name, (parent,), {'__mapper_args__': {'polymorphic_identity': name}})
+                )
+        classes += next_level
+        level = next_level
+    return Node, classes
+
+
+def main():
+    Node, classes = create_tree()
+    models = [
+        classes[i % len(classes)](id=i, name=f'Node {i}', value=i) for i in range(MODELS_COUNT)
+    ]
+
+    print(f'{len(classes)} classes, {MODELS_COUNT} models')
+    report(
+        '  serializer creation and first dump',
+        lambda: PolymorphicModelSerializer(Node).dump(models[-1]),
+        number=3,
+    )
+    serializer = PolymorphicModelSerializer(Node)
+    serializer.dump(models[-1])
+    report(
+        '  [serializer.dump(model) for model in models]',
+        lambda: [serializer.dump(model) for model in models],
+    )
+    report('  serializer.dump_many(models)', lambda: serializer.dump_many(models))
+
+
+if __name__ == '__main__':
+    main()
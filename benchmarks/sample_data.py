@@ -0,0 +1,67 @@
+"""
+Sample data shared by the benchmark scripts, based on the models used by the test suite.
+
+Benchmarks are plain scripts, run them from the repository root with serialchemy and its testing
+dependencies installed, for instance::
+
+    python benchmarks/bench_dump_many.py
+"""
+
+import timeit
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from serialchemy._tests import sample_model
+from serialchemy._tests.sample_model import Base
+
+
+def create_session():
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def seed_employees(session, count, contacts_per_employee=2):
+    """
+    Create `count` employees (of every Employee subclass) with their address, company and contacts.
+    """
+    company = sample_model.Company(id=1, name='Terrans', location='Korhal')
+    contact_type = sample_model.ContactType(label='email')
+    employee_classes = [
+        sample_model.Employee,
+        sample_model.Engineer,
+        sample_model.Manager,
+        sample_model.SpecialistEngineer,
+    ]
+    for i in range(count):
+        employee_class = employee_classes[i % len(employee_classes)]
+        employee = employee_class(
+            id=i + 1,
+            firstname=f'First {i}',
+            lastname=f'Last {i}',
+            email=f'employee{i}@terrans.com',
+            password='secret',
+            company=company,
+            admission=datetime(2000, 1, 1),
+            created_at=datetime(2000, 1, 2, 3, 4, 5),
+            contract_type=sample_model.ContractType.EMPLOYEE,
+            marital_status=sample_model.MaritalStatus.SINGLE,
+            address=sample_model.Address(street='5 Av', number=str(i), city='Tarsonis'),
+            contacts=[
+                sample_model.Contact(type=contact_type, value=f'{i}-{j}@terrans.com')
+                for j in range(contacts_per_employee)
+            ],
+        )
+        session.add(employee)
+    session.commit()
+
+
+def report(name, function, number=5):
+    """
+    Print the best time of `number` runs of `function`, in milliseconds.
+    """
+    best = min(timeit.repeat(function, number=1, repeat=number))
+    print(f'{name:<50} {best * 1000:10.2f} ms')
+    return best
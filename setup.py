@@ -9,10 +9,13 @@ with open("CHANGELOG.rst", encoding="UTF-8") as changelog_file:
 
 requirements = ["sqlalchemy>=1.4,<2.0"]
 extras_require = {
+    "numpy": ["numpy"],
     "docs": ["sphinx >= 1.4", "sphinx_rtd_theme", "sphinx-autodoc-typehints", "typing_extensions"],
     "testing": [
+        "aiosqlite",
         "codecov",
         "mypy",
+        "numpy",
         "pytest",
         "pytest-cov",
         "pytest-regressions",
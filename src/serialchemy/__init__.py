@@ -1,3 +1,5 @@
+from .dump_cache import DumpCache
+from .dump_context import DumpContext
 from .enum_field import EnumKeyField
 from .field import Field
 from .model_serializer import ModelSerializer
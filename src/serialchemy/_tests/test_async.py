@@ -0,0 +1,151 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import select
+
+from serialchemy import ModelSerializer
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy import PrimaryKeyField
+
+pytest.importorskip('aiosqlite')
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+
+@pytest.fixture()
+def run_async(metadata, tmp_path):
+    """
+    Run a coroutine function with an `AsyncSession` of a database with the sample model tables.
+    """
+
+    def run(function):
+        async def main():
+            engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "db.sqlite"}')
+            async with engine.begin() as connection:
+                await connection.run_sync(metadata.create_all)
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    return await function(session)
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+def getEmployeeSerializer(model):
+    class EmployeeSerializer(ModelSerializer):
+        company = NestedModelField(model.Company)
+        address = NestedModelField(model.Address)
+        departments = NestedModelListField(model.Department)
+
+    return EmployeeSerializer
+
+
+def seed_departments(model, session):
+    session.add(model.Company(id=5, name='Terrans', location='Korhal'))
+    session.add(model.Address(id=1, street='5 Av', number='943', city='Tarsonis', state='NA'))
+    session.add_all([model.Department(id=i, name=f'Department {i}') for i in range(1, 5)])
+
+
+def test_aload(model, run_async, statements_recorder):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    serialized = {
+        'id': 1,
+        'firstname': 'Jim',
+        'lastname': 'Raynor',
+        'email': 'some@email.com',
+        'role': 'Employee',
+        'company': {'id': 5},
+        'address': {'id': 1, 'zip': '88088-000'},
+        'departments': [{'id': 3}, {'id': 1}, {'id': 4}],
+    }
+
+    async def load(session):
+        seed_departments(model, session)
+        await session.commit()
+        session.expunge_all()
+
+        with statements_recorder(session.sync_session) as statements:
+            employee = await serializer.aload(serialized, session=session)
+        assert employee.company.name == 'Terrans'
+        assert employee.address.street == '5 Av'
+        assert employee.address.zip == '88088-000'
+        assert [department.id for department in employee.departments] == [3, 1, 4]
+        # One statement for each nested field
+        assert len(statements) == 3
+
+        session.add(employee)
+        await session.commit()
+        employees = await serializer.aload_many(
+            [dict(serialized, id=2, firstname='James', departments=[])], session=session
+        )
+        assert employees[0].firstname == 'James'
+        assert employees[0].company.location == 'Korhal'
+
+    run_async(load)
+
+
+def test_field_aload(model, run_async):
+    field = PrimaryKeyField(model.Department)
+
+    async def load(session):
+        seed_departments(model, session)
+        await session.commit()
+
+        departments = await field.aload([4, 2], session)
+        assert [department.name for department in departments] == ['Department 4', 'Department 2']
+
+    run_async(load)
+
+
+@pytest.mark.parametrize('json_array', [False, True])
+def test_adump_stream(model, run_async, json_array, statements_recorder):
+    class EmployeeSerializer(ModelSerializer):
+        company = NestedModelField(model.Company)
+        departments = PrimaryKeyField(model.Department)
+
+    serializer = EmployeeSerializer(model.Employee)
+
+    async def dump(session):
+        seed_departments(model, session)
+        for i in range(1, 8):
+            employee = model.Employee(
+                id=i, firstname=f'First {i}', lastname='Last', email='some', role='Employee'
+            )
+            employee.company = await session.get(model.Company, 5)
+            employee.departments = [await session.get(model.Department, i % 4 + 1)]
+            session.add(employee)
+        await session.commit()
+        session.expunge_all()
+
+        statement = select(model.Employee).order_by(model.Employee.id)
+        with statements_recorder(session.sync_session) as statements:
+            chunks = [
+                chunk
+                async for chunk in serializer.adump_stream(
+                    session, statement, batch_size=3, json_array=json_array
+                )
+            ]
+        # Employees (with companies) and departments of each partition
+        assert len(statements) == 4
+        assert list(session.sync_session) == []
+
+        expected = serializer.dump_many(
+            (await session.execute(statement.options(*serializer.loader_options()))).scalars()
+        )
+        return chunks, expected
+
+    chunks, expected = run_async(dump)
+    content = b''.join(chunks)
+    if json_array:
+        assert len(chunks) == 5
+        assert json.loads(content) == expected
+    else:
+        assert len(chunks) == 3
+        assert [json.loads(line) for line in content.splitlines()] == expected
+    assert expected[0]['company']['name'] == 'Terrans'
+    assert expected[0]['departments'] == [2]
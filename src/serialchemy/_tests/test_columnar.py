@@ -0,0 +1,74 @@
+import pytest
+
+from serialchemy import Field
+from serialchemy import ModelSerializer
+from serialchemy import PolymorphicModelSerializer
+from serialchemy._tests.test_serialization import getEmployeeSerializer
+from serialchemy._tests.test_serialization import seed_data
+
+np = pytest.importorskip('numpy')
+
+
+def test_dump_columns(model, db_session):
+    seed_data(db_session, model)
+
+    class EmployeeSerializer(getEmployeeSerializer(model)):
+        _salary = Field()
+
+    serializer = EmployeeSerializer(model.Employee)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    columns = serializer.dump_columns(employees)
+    serialized = serializer.dump_many(employees)
+
+    assert list(columns) == list(serialized[0])
+    assert 'password' not in columns
+    assert columns['id'].dtype == np.int64
+    assert columns['id'].tolist() == [1, 2, 3, 4]
+    assert columns['_salary'].dtype == np.float64
+    assert columns['_salary'].tolist() == [400, 21.12, 21.12, 21.12]
+    assert columns['created_at'].dtype == np.dtype('datetime64[us]')
+    assert columns['admission'].dtype == np.dtype('datetime64[D]')
+    assert columns['admission'][0] == np.datetime64('2000-01-01')
+    assert columns['contract_type'].tolist() == ['Contractor', 'Other', 'Employee', 'Other']
+    assert columns['contacts'].dtype == object
+    assert columns['contacts'].tolist() == [[], [], [], []]
+    assert columns['address'][0] == serialized[0]['address']
+
+    # Nullable columns with None values are masked
+    marital_status = columns['marital_status']
+    assert isinstance(marital_status, np.ma.MaskedArray)
+    assert marital_status.mask.tolist() == [False, False, False, True]
+    assert marital_status.compressed().tolist() == ['MARRIED', 'MARRIED', 'SINGLE']
+    for name, column in columns.items():
+        assert np.ma.getdata(column).shape == (4,)
+        expected = [item[name] for item in serialized]
+        if name not in ('created_at', 'admission'):
+            assert column.tolist() == expected
+
+
+def test_dump_columns_empty(model):
+    columns = ModelSerializer(model.Company).dump_columns([])
+    assert columns['id'].dtype == np.int64
+    assert columns['name'].dtype == object
+    assert all(len(column) == 0 for column in columns.values())
+
+
+def test_dump_columns_custom_dump(model, db_session):
+    seed_data(db_session, model)
+
+    class EmployeeSerializer(ModelSerializer):
+        password = Field(load_only=True)
+
+        def dump(self, model):
+            serial = super().dump(model)
+            serial['extra'] = 1
+            return serial
+
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    columns = EmployeeSerializer(model.Employee).dump_columns(employees)
+    assert columns['extra'].tolist() == [1, 1, 1, 1]
+    assert 'password' not in columns
+
+    columns = PolymorphicModelSerializer(model.Employee).dump_columns(employees)
+    assert columns['id'].tolist() == [1, 2, 3, 4]
+    assert columns['specialization'].mask.tolist() == [True, True, True, False]
@@ -49,3 +49,50 @@ def test_date_load():
 def test_date_with_time_warning():
     with pytest.warns(UserWarning, match="date shouldn't have non-zero values"):
         DateSerializer.load("2010-02-03T02:15")
+
+
+@pytest.mark.parametrize(
+    "serialized_date",
+    [
+        "1994-07-17",
+        "1994-07-17T20:53",
+        "1994-07-17 20:53:12",
+        "1994-07-17T20:53:12.000302",
+        "1994-07-17T20:53:12.302",
+        "1994-07-17T20:53:12+03:00",
+        "1994-07-17T20:53:12.000302-00:30",
+        "1994-07-17T20:53:12-02:30",
+        "1994-07-17T20:53:12-02:00",
+        "1994-07-17T20:53:12z",
+        "1994-07-17T20",
+        "1994-07-17X20:53:12",
+        "94-07-17T20:53:12",
+        "1994-07-17T20:53:12.1+0530",
+        "1994-07-17T20:53:12.12-0530",
+        "1994-07-17T20:53:12.123+05",
+        "2020-01-02T10:20:30+-1:00",
+        "1999-12-31T10:20:30+01:0T",
+    ],
+)
+def test_datetime_iso_format_same_as_lenient(serialized_date):
+    loaded = DateTimeSerializer.load(serialized_date)
+    expected = DateTimeSerializer._load_lenient(serialized_date)
+    assert loaded == expected
+    assert loaded.utcoffset() == expected.utcoffset()
+
+
+def test_datetime_load_many():
+    serializer = DateTimeSerializer
+    loaded = serializer.load_many(["1994-07-17T20:53:12+03:00", "1994-07-17T21:53:12+03:00"])
+    assert loaded == [
+        datetime(1994, 7, 17, 20, 53, 12, tzinfo=timezone(timedelta(hours=3))),
+        datetime(1994, 7, 17, 21, 53, 12, tzinfo=timezone(timedelta(hours=3))),
+    ]
+    # Timezones are shared by the loaded values
+    assert loaded[0].tzinfo is loaded[1].tzinfo
+    assert DateSerializer.load_many(["2010-02-03", "2010-02-04"]) == [
+        date(2010, 2, 3),
+        date(2010, 2, 4),
+    ]
+    with pytest.raises(ValueError, match="Could not parse DateTime"):
+        serializer.load_many(["1994-07-17", "invalid"])
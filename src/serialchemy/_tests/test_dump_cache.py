@@ -0,0 +1,193 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import update
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+import serialchemy
+from serialchemy import DumpCache
+from serialchemy import ModelSerializer
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy import PolymorphicModelSerializer
+
+
+def getEmployeeSerializer(model):
+    class EmployeeSerializer(ModelSerializer):
+        company = NestedModelField(model.Company)
+        contacts = NestedModelListField(model.Contact)
+
+    return EmployeeSerializer
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_dump_cache(model, db_session, statements_recorder):
+    cache = DumpCache()
+    serializer = getEmployeeSerializer(model)(model.Employee, dump_cache=cache)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+
+    serialized = serializer.dump_many(employees)
+    assert serialized == getEmployeeSerializer(model)(model.Employee).dump_many(employees)
+    assert cache.cache_info() == (0, 8, 1024, 8)
+
+    with statements_recorder(db_session) as statements:
+        assert serializer.dump(employees[0]) is serialized[0]
+        assert serializer.dump_many(employees) == serialized
+    assert statements == []
+    assert cache.cache_info() == (9, 8, 1024, 8)
+
+    # Cache keys include the serializer
+    other_serializer = getEmployeeSerializer(model)(model.Employee, dump_cache=cache)
+    assert other_serializer.dump(employees[0]) is not serialized[0]
+    assert cache.cache_info().currsize == 9
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 1024, 0)
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_dump_cache_invalidation(model, db_session):
+    cache = DumpCache()
+    serializer = getEmployeeSerializer(model)(model.Employee, dump_cache=cache)
+    employee = db_session.query(model.Employee).get(1)
+    serializer.dump(employee)
+
+    # Models with pending changes are not cached
+    employee.firstname = 'Jim'
+    assert cache.cache_info().currsize == 0
+    assert serializer.dump(employee)['firstname'] == 'Jim'
+    assert cache.cache_info().currsize == 0
+    db_session.commit()
+    assert serializer.dump(employee)['firstname'] == 'Jim'
+    assert cache.cache_info().currsize == 1
+
+    # A change of a nested model invalidates the models nesting it
+    employee.company.name = 'Dominion'
+    assert cache.cache_info().currsize == 0
+    db_session.commit()
+    assert serializer.dump(employee)['company']['name'] == 'Dominion'
+
+    serializer.dump(employee)
+    contact_type = employee.contacts[0].type
+    if hasattr(model.Contact, 'employee'):
+        # Invalidated when the contact is flushed, since only its many-to-one side is set
+        db_session.add(model.Contact(type=contact_type, value='new@email.com', employee=employee))
+    else:
+        employee.contacts.append(model.Contact(type=contact_type, value='new@email.com'))
+    db_session.commit()
+    assert cache.cache_info().currsize == 0
+    assert [contact['value'] for contact in serializer.dump(employee)['contacts']] == [
+        '1@email.com',
+        'new@email.com',
+    ]
+
+    employee.contacts[0].value = 'changed@email.com'
+    assert cache.cache_info().currsize == 0
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_dump_cache_flush(model, db_session):
+    cache = DumpCache()
+    serializer = getEmployeeSerializer(model)(model.Employee, dump_cache=cache)
+    employee = db_session.query(model.Employee).get(1)
+    serializer.dump(employee)
+    db_session.close()
+
+    # Models changed by another session are invalidated when flushed
+    other_session = sessionmaker(bind=db_session.get_bind())()
+    other_session.query(model.Employee).get(1).lastname = 'Raynor'
+    other_session.commit()
+    assert cache.cache_info().currsize == 0
+
+    employee = db_session.query(model.Employee).get(1)
+    assert serializer.dump(employee)['lastname'] == 'Raynor'
+
+    other_session.delete(other_session.query(model.Employee).get(1))
+    other_session.flush()
+    assert cache.cache_info().currsize == 0
+    other_session.rollback()
+
+
+def test_dump_cache_lru(model, db_session):
+    cache = DumpCache(maxsize=2)
+    serializer = ModelSerializer(model.Department, dump_cache=cache)
+    db_session.add_all([model.Department(id=i, name=f'Department {i}') for i in range(1, 4)])
+    db_session.commit()
+    departments = db_session.query(model.Department).order_by(model.Department.id).all()
+
+    serializer.dump_many(departments)
+    serializer.dump(departments[1])
+    serializer.dump(departments[0])
+    assert cache.cache_info() == (1, 4, 2, 2)
+    serializer.dump(departments[2])
+    assert cache.cache_info() == (1, 5, 2, 2)
+
+    # The evicted entry does not hold its identity key
+    departments[1].name = 'Changed'
+    assert cache.cache_info().currsize == 2
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_polymorphic_dump_cache(model, db_session):
+    cache = DumpCache()
+    serializer = PolymorphicModelSerializer(model.Employee, dump_cache=cache)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    serialized = serializer.dump_many(employees)
+    assert serializer.dump_many(employees) == serialized
+    assert serializer.dump(employees[2]) is serialized[2]
+    assert cache.cache_info() == (9, 8, 1024, 8)
+
+
+def test_dump_cache_version_id_col():
+    Base = declarative_base()
+
+    class Document(Base):
+        __tablename__ = 'Document'
+
+        id = Column(Integer, primary_key=True)
+        title = Column(String)
+        version = Column(Integer, nullable=False)
+
+        __mapper_args__ = {'version_id_col': version}
+
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Document(id=1, title='Draft'))
+    session.commit()
+
+    cache = DumpCache()
+    serializer = ModelSerializer(Document, dump_cache=cache)
+    document = session.query(Document).get(1)
+    assert serializer.dump(document) == {'id': 1, 'title': 'Draft', 'version': 1}
+
+    # Changes made without the ORM are seen through the version
+    session.execute(update(Document).values(title='Final', version=Document.version + 1))
+    session.expire(document)
+    assert serializer.dump(document) == {'id': 1, 'title': 'Final', 'version': 2}
+    assert cache.cache_info() == (0, 2, 1024, 2)
+
+
+def test_session_events_listened_once_cache_created():
+    # A new interpreter, since caches are already created by other tests
+    code = '\n'.join(
+        [
+            'from sqlalchemy import event',
+            'from sqlalchemy.orm import Session',
+            'import serialchemy',
+            'from serialchemy.dump_cache import _invalidate_flushed',
+            'listened = lambda: event.contains(Session, "after_flush", _invalidate_flushed)',
+            'assert not listened()',
+            'serialchemy.DumpCache()',
+            'assert listened()',
+        ]
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(serialchemy.__file__)))
+    subprocess.run([sys.executable, '-c', code], check=True, env=env)
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import pytest
+
+from serialchemy import PolymorphicModelSerializer
+from serialchemy._tests.test_loader_options import getEmployeeSerializer
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_dump_changes(model, db_session, statements_recorder):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    employee = (
+        db_session.query(model.Employee).options(*serializer.loader_options()).filter_by(id=1).one()
+    )
+    assert serializer.dump_changes(employee) == {}
+
+    employee.firstname = 'Jim'
+    employee.created_at = datetime(2020, 1, 2, 3, 4)
+    employee.marital_status = model.MaritalStatus.MARRIED
+    employee.password = 'changed'
+    employee.address.city = 'Mar Sara'
+    employee.contacts[0].value = 'jim@email.com'
+    with statements_recorder(db_session) as statements:
+        changes = serializer.dump_changes(employee)
+    assert statements == []
+    assert changes == {
+        'firstname': 'Jim',
+        'created_at': '2020-01-02T03:04:00',
+        'marital_status': 'Married',
+        'address': {'city': 'Mar Sara'},
+        'contacts': [{'id': employee.contacts[0].id, 'value': 'jim@email.com'}],
+    }
+    db_session.commit()
+    assert serializer.dump_changes(employee) == {}
+
+    # Unchanged attributes are not loaded
+    employee.departments = []
+    employee.lastname = 'Raynor'
+    with statements_recorder(db_session) as statements:
+        changes = serializer.dump_changes(employee)
+    assert statements == []
+    assert changes == {'lastname': 'Raynor', 'departments': []}
+
+    employee.address = model.Address(street='Main', number='1', city='Tarsonis', state='NA')
+    assert serializer.dump_changes(employee)['address'] == {
+        'id': None,
+        'street': 'Main',
+        'number': '1',
+        'zip': None,
+        'city': 'Tarsonis',
+        'state': 'NA',
+    }
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_polymorphic_dump_changes(model, db_session):
+    serializer = PolymorphicModelSerializer(model.Employee)
+    engineer = db_session.query(model.Employee).get(3)
+    assert type(engineer) is model.SpecialistEngineer
+    engineer.specialization = 'Mechanical'
+    assert serializer.dump_changes(engineer) == {'specialization': 'Mechanical'}
@@ -0,0 +1,111 @@
+import json
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from serialchemy import Field
+from serialchemy import ModelSerializer
+from serialchemy import NestedAttributesField
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy import PolymorphicModelSerializer
+from serialchemy import PrimaryKeyField
+from serialchemy._tests.test_serialization import getEmployeeSerializer
+from serialchemy._tests.test_serialization import seed_data
+
+
+def getSerializerClasses(model):
+    class EmployeeSerializerNestedFields(ModelSerializer):
+        password = Field(load_only=True)
+        company = NestedModelField(model.Company)
+        address = NestedAttributesField(("id", "street"))
+
+    class CompanySerializer(ModelSerializer):
+        employees = PrimaryKeyField(model.Employee)
+
+    return [
+        (ModelSerializer, model.Employee, 1),
+        (getEmployeeSerializer(model), model.Employee, 2),
+        (EmployeeSerializerNestedFields, model.Employee, 3),
+        (PolymorphicModelSerializer, model.Employee, 4),
+        (CompanySerializer, model.Company, 5),
+    ]
+
+
+def test_compiled_dump_matches_dump(model, db_session):
+    seed_data(db_session, model)
+
+    for serializer_class, model_class, pk in getSerializerClasses(model):
+        entity = db_session.query(model_class).get(pk)
+        serialized = serializer_class(model_class).dump(entity)
+        compiled_serializer = serializer_class(model_class, compiled=True)
+        assert compiled_serializer.compiled
+        compiled = compiled_serializer.dump(entity)
+        assert json.dumps(compiled) == json.dumps(serialized)
+
+
+def test_compiled_dump_skips_load_only_fields(model, db_session):
+    seed_data(db_session, model)
+
+    serializer = getEmployeeSerializer(model)(model.Employee, compiled=True)
+    serialized = serializer.dump(db_session.query(model.Employee).get(1))
+    assert 'password' not in serialized
+    assert serialized['marital_status'] == 'MARRIED'
+    assert serialized['contract_type'] == 'Contractor'
+
+
+def test_compiled_dump_missing_attribute(model):
+    class EmployeeSerializerUnknownField(ModelSerializer):
+        unknown = Field()
+
+    serializer = EmployeeSerializerUnknownField(model.Employee, compiled=True)
+    employee = model.Employee(firstname='Jim', lastname='Raynor', email='some', role='Employee')
+    with pytest.warns(UserWarning, match="does not have attribute 'unknown'"):
+        serialized = serializer.dump(employee)
+    assert serialized['unknown'] is None
+    assert serialized['firstname'] == 'Jim'
+
+
+def test_dump_json(model, db_session):
+    seed_data(db_session, model)
+
+    for serializer_class, model_class, pk in getSerializerClasses(model):
+        serializer = serializer_class(model_class)
+        entity = db_session.query(model_class).get(pk)
+        expected = json.dumps(serializer.dump(entity), separators=(',', ':')).encode()
+        assert serializer.dump_json(entity) == expected
+
+    serializer = PolymorphicModelSerializer(model.Employee)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    expected = json.dumps(serializer.dump_many(employees), separators=(',', ':')).encode()
+    assert serializer.dump_json_many(employees) == expected
+    assert serializer.dump_json_many([]) == b'[]'
+
+
+def test_dump_json_values(model):
+    class EmployeeSerializer(ModelSerializer):
+        password = Field(load_only=True)
+        contacts = NestedModelListField(model.Contact)
+
+    serializer = EmployeeSerializer(model.Employee)
+    employee = model.Employee(
+        firstname='Zoë "The" Ünïcode',
+        lastname='\n',
+        email=None,
+        role='Employee',
+        created_at=datetime(2000, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    )
+    employee.id = True
+    serialized = json.loads(serializer.dump_json(employee))
+    assert serialized['firstname'] == 'Zoë "The" Ünïcode'
+    assert serialized['lastname'] == '\n'
+    assert serialized['email'] is None
+    assert serialized['id'] is True
+    assert serialized['created_at'] == '2000-01-02T03:04:05+00:00'
+    assert serialized['contacts'] == []
+    assert 'password' not in serialized
+    assert (
+        serializer.dump_json(employee)
+        == json.dumps(serializer.dump(employee), separators=(',', ':')).encode()
+    )
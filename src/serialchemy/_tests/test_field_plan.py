@@ -0,0 +1,137 @@
+from datetime import datetime
+from enum import Enum
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.types import Enum as EnumType
+from sqlalchemy.types import TypeDecorator
+
+from serialchemy import ColumnSerializer
+from serialchemy import Field
+from serialchemy import ModelSerializer
+from serialchemy.datetime_serializer import DateColumnSerializer
+from serialchemy.datetime_serializer import DateTimeColumnSerializer
+from serialchemy.enum_serializer import EnumSerializer
+from serialchemy.field import DefaultFieldSerializer
+from serialchemy.serializer_checks import is_datetime_column
+
+
+class ColorDecorator(TypeDecorator):
+    impl = EnumType
+    cache_ok = True
+
+
+class UpperCaseSerializer(ColumnSerializer):
+    def dump(self, value):
+        return value.upper()
+
+    def load(self, serialized, session=None):
+        return serialized.lower()
+
+
+def test_default_serializers_resolved_on_construction(model):
+    serializer = ModelSerializer(model.Employee)
+    plan = serializer.plan
+
+    assert isinstance(plan.by_name['created_at'].field.serializer, DateTimeColumnSerializer)
+    assert isinstance(plan.by_name['admission'].field.serializer, DateColumnSerializer)
+    assert isinstance(plan.by_name['marital_status'].field.serializer, EnumSerializer)
+    assert isinstance(plan.by_name['firstname'].field.serializer, DefaultFieldSerializer)
+    assert plan.by_name['firstname'].identity
+    # ChoiceType columns may return Enums, so they are converted by DefaultFieldSerializer
+    assert not plan.by_name['contract_type'].identity
+
+
+def test_declared_fields_are_not_changed(model):
+    class EmployeeSerializer(ModelSerializer):
+        created_at = Field(dump_only=True)
+
+    serializer = EmployeeSerializer(model.Employee)
+    employee = model.Employee(
+        firstname='Jim',
+        lastname='Raynor',
+        email='some',
+        role='Employee',
+        created_at=datetime(2000, 1, 2),
+    )
+    assert serializer.dump(employee)['created_at'] == '2000-01-02T00:00:00'
+
+    assert isinstance(EmployeeSerializer.created_at.serializer, DefaultFieldSerializer)
+    assert serializer.fields['created_at'] is EmployeeSerializer.created_at
+    assert serializer.plan.by_name['created_at'].field is not EmployeeSerializer.created_at
+
+
+def test_plan_is_immutable(model):
+    plan = ModelSerializer(model.Employee).plan
+    with pytest.raises(AttributeError):
+        plan.fields = ()
+    with pytest.raises(TypeError):
+        plan.by_name['firstname'] = None
+
+
+def test_column_serializers_registry(model):
+    class UpperCaseModelSerializer(ModelSerializer):
+        COLUMN_SERIALIZERS = ModelSerializer.COLUMN_SERIALIZERS.copy()
+        COLUMN_SERIALIZERS.register(String, UpperCaseSerializer)
+
+    serializer = UpperCaseModelSerializer(model.Employee)
+    employee = model.Employee(
+        firstname='Jim',
+        lastname='Raynor',
+        email='some',
+        role='Employee',
+        created_at=datetime(2000, 1, 2),
+    )
+    serialized = serializer.dump(employee)
+    assert serialized['firstname'] == 'JIM'
+    assert serialized['created_at'] == '2000-01-02T00:00:00'
+    loaded = serializer.load(
+        {'firstname': 'JIM', 'lastname': 'R', 'email': 'E', 'role': 'Employee'}
+    )
+    assert loaded.firstname == 'jim'
+
+    assert ModelSerializer(model.Employee).dump(employee)['firstname'] == 'Jim'
+
+
+def test_extra_serializers(model):
+    class DateTimeModelSerializer(ModelSerializer):
+        EXTRA_SERIALIZERS = [(UpperCaseSerializer, is_datetime_column)]
+
+    serializer = DateTimeModelSerializer(model.Employee)
+    spec = serializer.plan.by_name['created_at']
+    assert isinstance(spec.field.serializer, UpperCaseSerializer)
+
+
+def test_column_serializers_of_type_subclasses():
+    class Color(Enum):
+        RED = 'red'
+
+    class DateDecorator(TypeDecorator):
+        impl = Date
+        cache_ok = True
+
+    Base = declarative_base()
+
+    class Paint(Base):
+        __tablename__ = 'paint'
+        id = Column(Integer, primary_key=True)
+        color = Column(postgresql.ENUM(Color, name='color'))
+        decorated_color = Column(ColorDecorator(Color))
+        made = Column(DateDecorator)
+
+    serializer = ModelSerializer(Paint)
+    plan = serializer.plan
+    assert isinstance(plan.by_name['color'].field.serializer, EnumSerializer)
+    assert isinstance(plan.by_name['decorated_color'].field.serializer, EnumSerializer)
+    # Decorated dates are not converted, as before the registry
+    assert isinstance(plan.by_name['made'].field.serializer, DefaultFieldSerializer)
+
+    paint = serializer.load({'id': 1, 'color': 'red', 'decorated_color': 'red'})
+    assert paint.color is Color.RED
+    assert paint.decorated_color is Color.RED
+    assert serializer.dump(paint)['color'] == 'red'
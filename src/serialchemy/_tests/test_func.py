@@ -1,6 +1,7 @@
 import pytest
 
 from serialchemy import func
+from serialchemy import PolymorphicModelSerializer
 
 
 @pytest.fixture(autouse=True)
@@ -38,3 +39,34 @@ def test_load(model, db_session):
     assert employee.role == "Employee"
     assert employee.firstname == "Sarah"
     assert employee.company_name == "Terrans"
+
+
+def test_serializer_cache(model, db_session):
+    func.clear_serializer_cache()
+    employee = db_session.query(model.Employee).get(2)
+
+    func.dump(employee)
+    func.dump(employee)
+    func.dump(employee, nest_foreign_keys=True)
+    assert func.serializer_cache_info() == func.CacheInfo(hits=1, misses=2, maxsize=128, currsize=2)
+
+    serializer = func.get_serializer(model.Employee, serializer_class=PolymorphicModelSerializer)
+    assert isinstance(serializer, PolymorphicModelSerializer)
+    assert func.get_serializer(model.Employee) is func.get_serializer(model.Employee)
+
+    func.clear_serializer_cache()
+    assert func.serializer_cache_info() == func.CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+
+def test_serializer_cache_eviction(model):
+    cache = func.SerializerCache(maxsize=2)
+    employee_serializer = cache.get(model.Employee)
+    company_serializer = cache.get(model.Company)
+    assert cache.get(model.Employee) is employee_serializer
+
+    cache.get(model.Address)
+    assert cache.cache_info().currsize == 2
+    # Company serializer was the least recently used
+    assert cache.get(model.Employee) is employee_serializer
+    assert cache.get(model.Company) is not company_serializer
+    assert cache.cache_info() == func.CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
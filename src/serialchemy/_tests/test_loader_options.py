@@ -0,0 +1,133 @@
+import json
+
+import pytest
+from sqlalchemy import inspect
+
+from serialchemy import Field
+from serialchemy import ModelSerializer
+from serialchemy import nested_fields
+from serialchemy import NestedAttributesField
+from serialchemy import NestedModelField
+from serialchemy import NestedModelListField
+from serialchemy import PolymorphicModelSerializer
+from serialchemy import PrimaryKeyField
+
+
+def getEmployeeSerializer(model):
+    class EmployeeSerializer(ModelSerializer):
+        password = Field(load_only=True)
+        address = NestedModelField(model.Address)
+        company = NestedAttributesField(('name', 'location'))
+        contacts = NestedModelListField(model.Contact)
+        departments = PrimaryKeyField(model.Department)
+
+    return EmployeeSerializer
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_loader_options_fixed_number_of_statements(model, db_session, statements_recorder):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    expected = serializer.dump_many(db_session.query(model.Employee).order_by(model.Employee.id))
+    db_session.expunge_all()
+
+    with statements_recorder(db_session) as statements:
+        query = db_session.query(model.Employee).options(*serializer.loader_options())
+        serialized = serializer.dump_many(query.order_by(model.Employee.id))
+
+    assert serialized == expected
+    assert all(item['contacts'] and item['departments'] == [1] for item in serialized)
+    # Employees with address and company, contacts and departments
+    assert len(statements) == 3
+    assert '.password' not in statements[0]
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_polymorphic_loader_options(model, db_session, statements_recorder):
+    serializer = PolymorphicModelSerializer(model.Employee)
+    expected = serializer.dump_many(db_session.query(model.Employee).order_by(model.Employee.id))
+    db_session.expunge_all()
+
+    with statements_recorder(db_session) as statements:
+        query = db_session.query(model.Employee).options(*serializer.loader_options())
+        serialized = serializer.dump_many(query.order_by(model.Employee.id))
+
+    assert serialized == expected
+    # Employees and one statement for each subclass
+    assert len(statements) == 4
+
+
+def test_loader_options_dynamic_relationship(model):
+    class CompanySerializer(ModelSerializer):
+        employees = PrimaryKeyField(model.Employee)
+
+    assert CompanySerializer(model.Company).loader_options() == []
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_primary_key_field_dynamic_relationship(model, db_session, statements_recorder):
+    class CompanySerializer(ModelSerializer):
+        employees = PrimaryKeyField(model.Employee)
+
+    serializer = CompanySerializer(model.Company)
+    company = db_session.query(model.Company).get(1)
+    with statements_recorder(db_session) as statements:
+        serialized = serializer.dump(company)
+
+    assert sorted(serialized['employees']) == list(range(1, 9))
+    assert len(statements) == 1
+    assert 'firstname' not in statements[0]
+    assert serializer.dump_json(company) == json.dumps(serialized, separators=(',', ':')).encode()
+
+
+@pytest.mark.usefixtures('seed_employees')
+@pytest.mark.parametrize('compiled', [False, True])
+def test_primary_key_field_unloaded_collection(model, db_session, compiled, statements_recorder):
+    class EmployeeSerializer(ModelSerializer):
+        departments = PrimaryKeyField(model.Department)
+
+    serializer = EmployeeSerializer(model.Employee, compiled=compiled)
+    employee = db_session.query(model.Employee).get(1)
+    with statements_recorder(db_session) as statements:
+        serialized = serializer.dump(employee)
+
+    assert serialized['departments'] == [1]
+    assert len(statements) == 1
+    assert '.name' not in statements[0]
+    assert 'departments' in inspect(employee).unloaded
+
+    # Loaded collections are dumped from memory, including pending changes
+    employee.departments.append(model.Department(id=2, name='Medics'))
+    with statements_recorder(db_session) as statements:
+        assert serializer.dump(employee)['departments'] == [1, 2]
+    assert statements == []
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_primary_key_field_load(model, db_session, monkeypatch, statements_recorder):
+    monkeypatch.setattr(nested_fields, 'PK_QUERY_CHUNK_SIZE', 2)
+    field = PrimaryKeyField(model.Employee)
+    # Already in the identity map, must not be queried
+    employee = db_session.query(model.Employee).get(5)
+
+    with statements_recorder(db_session) as statements:
+        employees = field.load([7, 5, 3, 7, 1, 2], session=db_session)
+
+    assert [employee.id for employee in employees] == [7, 5, 3, 1, 2]
+    assert employees[1] is employee
+    assert len(statements) == 2
+
+    with pytest.warns(UserWarning, match=r"Not all primary keys found .*: \[10, 12\]"):
+        employees = field.load([10, 1, 12], session=db_session)
+    assert [employee.id for employee in employees] == [1]
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_primary_key_field_load_string_keys(model, db_session, recwarn):
+    field = PrimaryKeyField(model.Employee)
+    db_session.query(model.Employee).get(5)
+    # Keys are converted to the column type, as they are by the query
+    employees = field.load(['2', '5', 1, 'bad'], session=db_session)
+    assert [employee.id for employee in employees] == [2, 5, 1]
+    assert [str(warning.message) for warning in recwarn] == [
+        "Not all primary keys found for 'Employee.Employee.id': ['bad']"
+    ]
@@ -2,9 +2,11 @@ import pytest
 from freezegun import freeze_time
 
 from serialchemy import ModelSerializer
+from serialchemy.dump_context import DumpContext
 from serialchemy.field import Field
 from serialchemy.nested_fields import NestedAttributesField
 from serialchemy.nested_fields import NestedModelField
+from serialchemy.nested_fields import NestedModelListField
 
 
 def getEmployeeSerializerNestedModelFields(model):
@@ -197,3 +199,164 @@ def test_load_with_nested_polymorphic_same_table_pk_names(model, db_session, dat
     data_regression.check(
         serializer.dump(entity), basename='test_load_with_nested_polymorphic_same_table_pk_names'
     )
+
+
+def test_load_nested_list_single_query(model, db_session, statements_recorder):
+    class EmployeeSerializer(ModelSerializer):
+        departments = NestedModelListField(model.Department)
+
+    db_session.add_all([model.Department(id=i, name=f'Department {i}') for i in range(1, 6)])
+    db_session.commit()
+    db_session.expunge_all()
+    # Already in the identity map, must not be queried
+    db_session.query(model.Department).get(2)
+
+    serializer = EmployeeSerializer(model.Employee)
+    serialized = {
+        'id': 3,
+        'firstname': 'Tychus',
+        'lastname': 'Findlay',
+        'email': 'some@email.com',
+        'role': 'Employee',
+        'departments': [
+            {'id': 4},
+            {'id': 2, 'name': 'Renamed'},
+            {'id': 0, 'name': 'New'},
+            {'id': 1},
+        ],
+    }
+    with statements_recorder(db_session) as statements:
+        employee = serializer.load(serialized, session=db_session)
+
+    # Item with a false primary key is created
+    assert len(statements) == 1
+    assert 'IN' in statements[0]
+    assert [department.id for department in employee.departments] == [4, 2, 0, 1]
+    assert [department.name for department in employee.departments] == [
+        'Department 4',
+        'Renamed',
+        'New',
+        'Department 1',
+    ]
+
+
+def test_load_nested_list_string_keys(model, db_session, statements_recorder):
+    class EmployeeSerializer(ModelSerializer):
+        departments = NestedModelListField(model.Department)
+
+    db_session.add_all([model.Department(id=i, name=f'Department {i}') for i in range(1, 4)])
+    db_session.commit()
+    db_session.expunge_all()
+
+    serializer = EmployeeSerializer(model.Employee)
+    serialized = {
+        'id': 3,
+        'firstname': 'Tychus',
+        'lastname': 'Findlay',
+        'email': 'some@email.com',
+        'role': 'Employee',
+        'departments': [{'id': '3'}, {'id': '1'}],
+    }
+    with statements_recorder(db_session) as statements:
+        employee = serializer.load(serialized, session=db_session)
+    # Existing departments are found by the single query
+    assert len(statements) == 1
+    assert [department.name for department in employee.departments] == [
+        'Department 3',
+        'Department 1',
+    ]
+
+
+def test_load_many_prefetches_nested_models(model, db_session, statements_recorder):
+    serializer = getEmployeeSerializerNestedModelFields(model)(model.Employee)
+    serialized_items = [serializer.dump(employee) for employee in db_session.query(model.Employee)]
+    db_session.expunge_all()
+
+    with statements_recorder(db_session) as statements:
+        employees = serializer.load_many(serialized_items, session=db_session)
+
+    # One query for addresses and another for companies
+    assert len(statements) == 2
+    assert [employee.id for employee in employees] == [item['id'] for item in serialized_items]
+    assert employees[0].company.name == 'Terrans'
+    assert employees[0].address is employees[1].address
+
+
+def getGraphSerializer(model):
+    """
+    Employees nesting their company, that nests its master manager (an employee again)
+    """
+
+    class EmployeeSerializer(ModelSerializer):
+        company = NestedModelField(
+            model.Company, serializer=getCompanySerializer(model)(model.Company)
+        )
+        contacts = NestedModelListField(model.Contact)
+
+    serializer = EmployeeSerializer(model.Employee)
+    company_serializer = serializer.fields['company'].serializer
+    company_serializer.fields['master_manager']._serializer = EmployeeSerializer(model.Manager)
+    return serializer
+
+
+def test_dump_context_shares_nested_models(model, db_session):
+    serializer = getEmployeeSerializerNestedModelFields(model)(model.Employee)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    expected = serializer.dump_many(employees)
+
+    context = DumpContext()
+    serialized = serializer.dump_many(employees, context=context)
+    assert serialized == expected
+    # Company and address of the second employee are the ones dumped for the first
+    assert serialized[1]['company'] is serialized[0]['company']
+    assert serialized[1]['address'] is serialized[0]['address']
+    assert context.hits == 2
+
+    serialized = serializer.dump_many(employees, context=DumpContext(refs=True))
+    # Only referenced models have an id
+    assert '$id' not in serialized[0]
+    assert serialized[0]['company'] == dict(expected[0]['company'], **{'$id': 'Company:5'})
+    assert serialized[1]['company'] == {'$ref': 'Company:5'}
+    assert serialized[1]['address'] == {'$ref': f"Address:{employees[0].address.id}"}
+    assert serialized[2]['company'] is None
+
+    assert serializer.dump(employees[0], context=DumpContext()) == expected[0]
+    compiled_serializer = getEmployeeSerializerNestedModelFields(model)(
+        model.Employee, compiled=True
+    )
+    serialized = compiled_serializer.dump_many(employees, context=DumpContext())
+    assert serialized == expected
+    assert serialized[1]['company'] is serialized[0]['company']
+
+
+def test_dump_context_cycles(model, db_session):
+    serializer = getGraphSerializer(model)
+    manager = db_session.query(model.Employee).get(1)
+
+    with pytest.raises(ValueError, match='Cycle detected dumping'):
+        serializer.dump(manager, context=DumpContext())
+
+    serialized = serializer.dump(manager, context=DumpContext(refs=True))
+    assert serialized['$id'] == 'Employee:1'
+    assert serialized['company']['master_manager'] == {'$ref': 'Employee:1'}
+
+    # The engineer is not the master manager, so the manager is dumped (nesting a ref to the
+    # company being dumped)
+    engineer = db_session.query(model.Employee).get(2)
+    serialized = serializer.dump(engineer, context=DumpContext(refs=True))
+    master_manager = serialized['company']['master_manager']
+    assert master_manager['firstname'] == 'Jim'
+    assert master_manager['company'] == {'$ref': 'Company:5'}
+
+
+def test_dump_context_max_depth(model, db_session):
+    serializer = getGraphSerializer(model)
+    engineer = db_session.query(model.Employee).get(2)
+
+    serialized = serializer.dump(engineer, context=DumpContext(max_depth=1))
+    assert serialized['company']['name'] == 'Terrans'
+    assert serialized['company']['master_manager'] == {'id': 1}
+
+    serialized = serializer.dump(engineer, context=DumpContext(max_depth=0))
+    assert serialized['company'] == {'id': 5}
+    assert serialized['firstname'] == 'Sarah'
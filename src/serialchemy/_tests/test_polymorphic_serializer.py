@@ -43,4 +43,111 @@ def test_polymorphic_pure_enum_identity_handling(db_session):
     assert serialized_obj["type"] == TestEnum.TYPE_A.value
 
     loaded_obj = serializer.load(serialized_obj, session=db_session)
-    assert isinstance(loaded_obj, TestA)
\ No newline at end of file
+    assert isinstance(loaded_obj, TestA)
+
+
+def test_polymorphic_sub_serializers_created_once(model, db_session):
+    created = []
+
+    class CountingSerializer(PolymorphicModelSerializer):
+        def __init__(self, declarative_class):
+            super().__init__(declarative_class)
+            created.append(declarative_class)
+
+    serializer = CountingSerializer(model.Employee)
+    assert created == [model.Employee]
+
+    employees = [
+        model_class(id=i, firstname='Jim', lastname='Raynor', email='some', role=role)
+        for i, (model_class, role) in enumerate(
+            [
+                (model.Employee, 'Employee'),
+                (model.Engineer, 'Engineer'),
+                (model.SpecialistEngineer, 'Specialist Engineer'),
+                (model.Manager, 'Manager'),
+            ]
+        )
+    ]
+    serialized = [serializer.dump(employee) for employee in employees]
+    assert sorted(created, key=lambda model_class: model_class.__name__) == [
+        model.Employee,
+        model.Engineer,
+        model.Manager,
+        model.SpecialistEngineer,
+    ]
+    assert set(serializer.class_serializers) == {
+        model.Engineer,
+        model.Manager,
+        model.SpecialistEngineer,
+    }
+    assert 'specialization' in serialized[2]
+    assert 'specialization' not in serialized[1]
+    assert serializer.dump_many(employees) == serialized
+
+
+def test_polymorphic_load_many(model, db_session, statements_recorder):
+    from serialchemy import NestedModelField
+
+    class EmployeeSerializer(PolymorphicModelSerializer):
+        company = NestedModelField(model.Company)
+
+    db_session.add(model.Company(id=5, name='Terrans', location='Korhal'))
+    db_session.commit()
+    db_session.expunge_all()
+
+    # Items without identity are loaded by the base class serializer
+    roles = ['Engineer', 'Manager', 'Employee', 'Engineer', '', 'Specialist Engineer']
+    serialized_items = [
+        {
+            'id': i,
+            'firstname': f'First {i}',
+            'lastname': 'Last',
+            'email': 'some',
+            'role': role,
+            'company': {'id': 5},
+        }
+        for i, role in enumerate(roles, start=1)
+    ]
+    serializer = EmployeeSerializer(model.Employee)
+    with statements_recorder(db_session) as statements:
+        employees = serializer.load_many(serialized_items, session=db_session)
+
+    # Company is queried by the first group, and found in the identity map by the others
+    assert len(statements) == 1
+    assert [type(employee) for employee in employees] == [
+        model.Engineer,
+        model.Manager,
+        model.Employee,
+        model.Engineer,
+        model.Employee,
+        model.SpecialistEngineer,
+    ]
+    assert [employee.id for employee in employees] == [1, 2, 3, 4, 5, 6]
+    assert all(employee.company.name == 'Terrans' for employee in employees)
+
+    mappings = serializer.load_many(
+        [{'id': 1, 'role': 'Specialist Engineer', 'specialization': 'Mechanical'}, {'id': 2}],
+        mode='mappings',
+    )
+    assert mappings == [
+        {'id': 1, 'role': 'Specialist Engineer', 'specialization': 'Mechanical'},
+        {'id': 2},
+    ]
+
+
+def test_polymorphic_sub_serializer_init_without_compiled(model):
+    class EmployeeSerializer(PolymorphicModelSerializer):
+        pass
+
+    class EngineerSerializer(EmployeeSerializer):
+        __model_class__ = model.Engineer
+
+        def __init__(self, declarative_class):
+            super().__init__(declarative_class)
+
+    serializer = EmployeeSerializer(model.Employee)
+    engineer = model.Engineer(
+        id=1, firstname='Jim', lastname='Raynor', email='some', role='Engineer'
+    )
+    assert serializer.dump(engineer)['firstname'] == 'Jim'
+    assert isinstance(serializer.class_serializers[model.Engineer], EngineerSerializer)
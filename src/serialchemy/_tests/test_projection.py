@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from serialchemy import ModelSerializer
+from serialchemy import PolymorphicModelSerializer
+from serialchemy._tests.test_loader_options import getEmployeeSerializer
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_projection(model, db_session):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    employee = db_session.query(model.Employee).get(1)
+    serialized = serializer.dump(employee)
+
+    only = ['id', 'firstname', 'address.street', 'contacts.value']
+    assert serializer.dump(employee, only=only) == {
+        'id': 1,
+        'firstname': 'First 1',
+        'address': {'street': '5 Av'},
+        'contacts': [{'value': '1@email.com'}],
+    }
+    # A whole field takes precedence over its nested fields
+    assert serializer.dump(employee, only=['address', 'address.street']) == {
+        'address': serialized['address']
+    }
+
+    excluded = serializer.dump(employee, exclude=['contacts', 'address.id', 'address.zip'])
+    expected = {
+        name: value for name, value in serialized.items() if name not in ('contacts', 'address')
+    }
+    expected['address'] = {
+        name: value for name, value in serialized['address'].items() if name not in ('id', 'zip')
+    }
+    assert excluded == expected
+    assert list(excluded) == [name for name in serialized if name != 'contacts']
+
+    assert serializer.dump_many([employee], only=['id']) == [{'id': 1}]
+    assert json.loads(serializer.dump_json(employee, only=['id', 'address.city'])) == {
+        'id': 1,
+        'address': {'city': 'Tarsonis'},
+    }
+    assert json.loads(serializer.dump_json_many([employee], exclude=only)) == [
+        serializer.dump(employee, exclude=only)
+    ]
+    # The serializer itself is unchanged
+    assert serializer.dump(employee) == serialized
+
+    compiled_serializer = getEmployeeSerializer(model)(model.Employee, compiled=True)
+    assert compiled_serializer.project(only=only).compiled
+    assert compiled_serializer.dump(employee, only=only) == serializer.dump(employee, only=only)
+
+
+def test_projection_cache(model):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    projection = serializer.project(only=['id', 'address.street'])
+    assert serializer.project(only=('address.street', 'id')) is projection
+    assert serializer.project(exclude=['id']) is not projection
+    assert serializer.project(only='id') is serializer.project(only=['id'])
+    # Nested projections are shared too
+    assert projection.fields['address'].serializer is serializer.fields[
+        'address'
+    ].serializer.project(only=['street'])
+
+    class SmallCacheSerializer(ModelSerializer):
+        PROJECTIONS_CACHE_SIZE = 2
+
+    serializer = SmallCacheSerializer(model.Employee)
+    for name in ['id', 'firstname', 'lastname', 'email']:
+        serializer.project(only=[name])
+    assert len(serializer._projections) == 2
+
+
+def test_projection_unknown_fields(model):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    with pytest.raises(ValueError, match='Unknown fields for Employee: bad, worse'):
+        serializer.project(only=['id', 'bad'], exclude=['worse'])
+    with pytest.raises(ValueError, match='Unknown fields for Address: bad'):
+        serializer.project(only=['address.bad'])
+    with pytest.raises(ValueError, match="Field 'departments' of Employee has no nested fields"):
+        serializer.project(only=['departments.id'])
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_projection_loader_options(model, db_session, statements_recorder):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    only = ['id', 'address.street']
+
+    with statements_recorder(db_session) as statements:
+        employees = (
+            db_session.query(model.Employee)
+            .options(*serializer.loader_options(only=only))
+            .order_by(model.Employee.id)
+        )
+        serialized = serializer.dump_many(employees, only=only)
+    # Unrequested relationships are neither loaded along with the employees nor dumped
+    assert len(statements) == 1
+    assert all('Contact' not in statement for statement in statements)
+    assert serialized[0] == {'id': 1, 'address': {'street': '5 Av'}}
+    assert len(serialized) == 8
+
+
+@pytest.mark.usefixtures('seed_employees')
+def test_polymorphic_projection(model, db_session):
+    serializer = PolymorphicModelSerializer(model.Employee)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+
+    # Fields of subclasses can be selected
+    serialized = serializer.dump_many(employees, only=['id', 'specialization'])
+    assert serialized[:4] == [{'id': 1}, {'id': 2}, {'id': 3, 'specialization': None}, {'id': 4}]
+    assert serializer.dump(employees[2], exclude=['specialization', 'engineer_name']) == {
+        name: value
+        for name, value in serializer.dump(employees[2]).items()
+        if name not in ('specialization', 'engineer_name')
+    }
+    with pytest.raises(ValueError, match='Unknown fields for Employee: bad'):
+        serializer.dump(employees[0], only=['bad'])
+
+
+def test_projection_one_shot_iterables(model):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    employee = model.Employee(
+        id=1, firstname='Jim', lastname='Raynor', email='some', role='Employee'
+    )
+    expected = {'id': 1, 'firstname': 'Jim'}
+    assert serializer.dump(employee, only=(name for name in ['id', 'firstname'])) == expected
+    # The cached projection is complete
+    assert serializer.dump(employee, only=['id', 'firstname']) == expected
+    assert serializer.project(exclude=iter(['contacts'])) is serializer.project(
+        exclude=['contacts']
+    )
+    assert 'contacts' not in serializer.project(exclude=['contacts']).fields
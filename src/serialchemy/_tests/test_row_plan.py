@@ -0,0 +1,181 @@
+import pickle
+from dataclasses import dataclass
+
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import composite
+
+from serialchemy import ColumnSerializer
+from serialchemy import Field
+from serialchemy import model_serializer
+from serialchemy import ModelSerializer
+from serialchemy._tests.test_serialization import getEmployeeSerializer
+from serialchemy._tests.test_serialization import seed_data
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+    def __composite_values__(self):
+        return self.x, self.y
+
+
+class PointSerializer(ColumnSerializer):
+    def __init__(self):
+        super().__init__(None)
+
+    def dump(self, value):
+        return [value.x, value.y]
+
+    def load(self, serialized, session=None):
+        return Point(*serialized)
+
+
+def test_dump_rows(model, db_session):
+    seed_data(db_session, model)
+
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    field_names = serializer.row_plan.field_names
+    assert 'password' not in field_names
+    assert 'address' not in field_names
+    assert 'marital_status' in field_names
+
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    expected = [
+        {key: value for key, value in serialized.items() if key in field_names}
+        for serialized in serializer.dump_many(employees)
+    ]
+    statement = serializer.row_select().order_by(model.Employee.id)
+    assert serializer.dump_rows(db_session.execute(statement)) == expected
+    assert serializer.dump_rows(db_session.execute(statement).mappings()) == expected
+    assert expected[0]['marital_status'] == 'MARRIED'
+    assert expected[0]['contract_type'] == 'Contractor'
+    assert expected[0]['created_at'] == '2000-01-02T00:00:00'
+
+
+def test_dump_row_composite(db_session):
+    Base = declarative_base()
+
+    class Shape(Base):
+        __tablename__ = 'Shape'
+
+        id = Column(Integer, primary_key=True)
+        x = Column(Integer)
+        y = Column(Integer)
+        position = composite(Point, x, y)
+        created = Column(Date)
+
+    class ShapeSerializer(ModelSerializer):
+        position = Field(serializer=PointSerializer())
+
+    Base.metadata.create_all(db_session.get_bind())
+    db_session.add(Shape(id=1, position=Point(2, 3)))
+    db_session.commit()
+
+    serializer = ShapeSerializer(Shape)
+    rows = db_session.execute(serializer.row_select()).all()
+    assert serializer.dump_rows(rows) == [serializer.dump(db_session.query(Shape).get(1))]
+    assert serializer.dump_row(rows[0]) == {
+        'id': 1,
+        'x': 2,
+        'y': 3,
+        'created': None,
+        'position': [2, 3],
+    }
+
+
+def test_dump_rows_single_table_inheritance(db_session):
+    Base = declarative_base()
+
+    class Vehicle(Base):
+        __tablename__ = 'Vehicle'
+
+        id = Column(Integer, primary_key=True)
+        kind = Column(String)
+        __mapper_args__ = {'polymorphic_on': kind, 'polymorphic_identity': 'vehicle'}
+
+    class Truck(Vehicle):
+        __mapper_args__ = {'polymorphic_identity': 'truck'}
+
+    class Bike(Vehicle):
+        __mapper_args__ = {'polymorphic_identity': 'bike'}
+
+    Base.metadata.create_all(db_session.get_bind())
+    db_session.add_all([Vehicle(id=1), Truck(id=2), Bike(id=3)])
+    db_session.commit()
+
+    serializer = ModelSerializer(Truck)
+    rows = db_session.execute(serializer.row_select()).all()
+    assert serializer.dump_rows(rows) == [{'id': 2, 'kind': 'truck'}]
+    assert serializer.dump_parallel(db_session.execute(serializer.row_select()), 1) == [
+        {'id': 2, 'kind': 'truck'}
+    ]
+
+
+def test_dump_parallel(model, db_session):
+    seed_data(db_session, model)
+
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    statement = serializer.row_select().order_by(model.Employee.id)
+    expected = serializer.dump_rows(db_session.execute(statement))
+    assert serializer.dump_parallel(db_session.execute(statement), 2, chunk_size=3) == expected
+    assert serializer.dump_parallel(db_session.execute(statement).mappings(), 1) == expected
+    assert serializer.dump_parallel([], 1) == []
+
+
+class LazyExecutor(object):
+    """
+    Executor running each function when its result is read, recording the number of pending
+    functions.
+    """
+
+    max_pending = 0
+
+    def __init__(self, max_workers):
+        self.pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def submit(self, function, *args):
+        self.pending += 1
+        LazyExecutor.max_pending = max(LazyExecutor.max_pending, self.pending)
+        executor = self
+
+        class Future(object):
+            def result(self):
+                executor.pending -= 1
+                return function(*args)
+
+        return Future()
+
+
+def test_dump_parallel_bounded_chunks(model, db_session, monkeypatch):
+    seed_data(db_session, model)
+    monkeypatch.setattr(model_serializer, 'ProcessPoolExecutor', LazyExecutor)
+    monkeypatch.setattr(LazyExecutor, 'max_pending', 0)
+
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    statement = serializer.row_select().order_by(model.Employee.id)
+    rows = db_session.execute(statement).all() * 10
+    expected = serializer.dump_rows(rows)
+    assert serializer.dump_parallel(rows, 2, chunk_size=1) == expected
+    # Rows are not all read (and sent to the workers) at once
+    assert LazyExecutor.max_pending == 4
+
+
+def test_row_dumper_pickle(model):
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    dumper = pickle.loads(pickle.dumps(serializer.row_plan.dumper))
+    row = [None] * len(serializer.row_plan.columns)
+    row[serializer.row_plan.keys.index('marital_status')] = model.MaritalStatus.MARRIED
+    assert dumper.dump_row(row) == serializer.row_plan.dump_row(row)
+    assert dumper.dump_row(row)['marital_status'] == 'MARRIED'
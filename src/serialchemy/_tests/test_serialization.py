@@ -1,3 +1,8 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
 from serialchemy.enum_field import EnumKeyField
 from serialchemy.field import Field
 from serialchemy.func import dump
@@ -305,3 +310,248 @@ def test_load_choice_type(model, db_session):
     db_session.commit()
 
     assert loaded.contract_type == model.ContractType.OTHER
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_dump_many(model, db_session, compiled):
+    seed_data(db_session, model)
+
+    serializer = getEmployeeSerializer(model)(model.Employee, compiled=compiled)
+    query = db_session.query(model.Employee).order_by(model.Employee.id)
+    serialized = serializer.dump_many(query)
+    assert serialized == [serializer.dump(employee) for employee in query]
+    assert [item['id'] for item in serialized] == [1, 2, 3, 4]
+    assert serializer.dump_many([]) == []
+
+
+def test_polymorphic_dump_many(model, db_session):
+    seed_data(db_session, model)
+
+    serializer = PolymorphicModelSerializer(model.Employee)
+    employees = db_session.query(model.Employee).order_by(model.Employee.id).all()
+    serialized = serializer.dump_many(employees)
+    assert serialized == [serializer.dump(employee) for employee in employees]
+    assert [item['role'] for item in serialized] == [
+        'Manager',
+        'Engineer',
+        'Employee',
+        'Specialist Engineer',
+    ]
+    assert serialized[3]['specialization'] == 'Mechanical'
+
+
+def test_dump_many_with_custom_dump(model, db_session):
+    seed_data(db_session, model)
+
+    class CustomDumpSerializer(ModelSerializer):
+        def dump(self, model):
+            serialized = super().dump(model)
+            serialized['custom'] = True
+            return serialized
+
+    serializer = CustomDumpSerializer(model.Employee)
+    serialized = serializer.dump_many(db_session.query(model.Employee))
+    assert all(item['custom'] for item in serialized)
+
+
+@pytest.mark.parametrize("json_array", [False, True])
+def test_dump_stream(model, db_session, json_array):
+    seed_data(db_session, model)
+
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    query = db_session.query(model.Employee).order_by(model.Employee.id)
+    expected = serializer.dump_many(query)
+
+    chunks = list(serializer.dump_stream(query, batch_size=3, json_array=json_array))
+    content = b''.join(chunks)
+    if json_array:
+        assert len(chunks) == 4
+        assert json.loads(content) == expected
+    else:
+        assert len(chunks) == 2
+        assert [json.loads(line) for line in content.splitlines()] == expected
+    assert not any(isinstance(entity, model.Employee) for entity in db_session)
+
+
+def test_dump_stream_select(model, db_session):
+    seed_data(db_session, model)
+
+    serializer = ModelSerializer(model.Company)
+    chunks = serializer.dump_stream(select(model.Company), db_session, json_array=True)
+    assert json.loads(b''.join(chunks)) == [
+        {
+            'id': 5,
+            'location': 'Korhal',
+            'master_engeneer_id': None,
+            'master_manager_id': None,
+            'name': 'Terrans',
+        }
+    ]
+
+    empty_query = select(model.Company).where(model.Company.id == 0)
+    assert b''.join(serializer.dump_stream(empty_query, db_session, json_array=True)) == b'[]'
+    assert b''.join(serializer.dump_stream(empty_query, db_session)) == b''
+
+
+def test_load_many_mappings(model, db_session):
+    seed_data(db_session, model)
+
+    serializer = getEmployeeSerializer(model)(model.Employee)
+    serialized_items = serializer.dump_many(
+        db_session.query(model.Employee).order_by(model.Employee.id)
+    )
+    for serialized in serialized_items:
+        serialized['id'] += 10
+        serialized['password'] = 'new'
+        del serialized['address']
+        del serialized['contacts']
+
+    mappings = serializer.load_many(serialized_items, mode='mappings')
+    # Dump only fields are not loaded
+    assert all('created_at' not in mapping for mapping in mappings)
+    assert all('company_name' not in mapping for mapping in mappings)
+    assert mappings[0]['marital_status'] == model.MaritalStatus.MARRIED
+    assert mappings[0]['password'] == 'new'
+
+    # Same values as the loaded models (but the choice type, converted by the model)
+    models = serializer.load_many(serialized_items)
+    for mapping, loaded in zip(mappings, models):
+        assert mapping.keys() == {'password', *serialized_items[0].keys()} - {
+            'created_at',
+            'company_name',
+        }
+        assert {key: value for key, value in mapping.items() if key != 'contract_type'} == {
+            key: getattr(loaded, key) for key in mapping if key != 'contract_type'
+        }
+
+    # Only the Employee, other roles have rows on the tables of subclasses
+    assert mappings[2]['role'] == 'Employee'
+    db_session.bulk_insert_mappings(model.Employee, mappings[2:3])
+    employee = db_session.query(model.Employee).get(13)
+    assert employee.firstname == 'Tychus'
+    assert employee.contract_type == model.ContractType.EMPLOYEE
+
+    with pytest.warns(UserWarning, match="'address' is not a column of Employee"):
+        serializer.load_many(
+            [{'id': 20, 'address': {}}, {'id': 21, 'address': {}}], mode='mappings'
+        )
+    with pytest.raises(ValueError, match="Invalid load mode"):
+        serializer.load_many([], mode='rows')
+
+
+def test_update(model, db_session, statements_recorder):
+    seed_data(db_session, model)
+
+    class EmployeeSerializer(getEmployeeSerializer(model)):
+        departments = PrimaryKeyField(model.Department)
+
+    serializer = EmployeeSerializer(model.Employee)
+    employee = db_session.query(model.Employee).get(3)
+    employee.departments = [model.Department(id=1, name='Marines')]
+    db_session.commit()
+    assert len(employee.departments) == 1
+    serialized = serializer.dump(employee)
+
+    # Sending the whole object again changes nothing
+    with statements_recorder(db_session) as statements:
+        assert serializer.update(serialized, employee, session=db_session) == set()
+        db_session.flush()
+    assert not any(statement.startswith('UPDATE') for statement in statements)
+    assert employee not in db_session.dirty
+
+    changed = serializer.update(
+        dict(serialized, firstname='Tychus J.', marital_status='MARRIED', departments=[]),
+        employee,
+        session=db_session,
+    )
+    assert changed == {'firstname', 'marital_status', 'departments'}
+    assert employee.firstname == 'Tychus J.'
+    assert employee.marital_status == model.MaritalStatus.MARRIED
+    assert employee.departments == []
+    db_session.commit()
+
+    # Attributes that are not loaded are assigned without loading them
+    db_session.refresh(employee)
+    db_session.expire(employee, ['lastname'])
+    with statements_recorder(db_session) as statements:
+        changed = serializer.update({'lastname': 'Findlay', 'email': 'some'}, employee)
+    assert statements == []
+    assert changed == {'lastname'}
+
+
+def test_polymorphic_update(model, db_session):
+    seed_data(db_session, model)
+    serializer = PolymorphicModelSerializer(model.Employee)
+    engineer = db_session.query(model.Employee).get(4)
+    serialized = serializer.dump(engineer)
+    assert serializer.update(serialized, engineer) == set()
+    assert serializer.update(dict(serialized, specialization='Civil'), engineer) == {
+        'specialization'
+    }
+
+
+def test_load_plan(model, recwarn):
+    class EmployeeSerializer(getEmployeeSerializer(model)):
+        role = Field(creation_only=True)
+
+    serializer = EmployeeSerializer(model.Employee)
+    plan = serializer._load_plan
+    assert 'created_at' not in plan.loaders
+    assert sorted(name for name, _ in plan.session_fields) == ['address', 'contacts']
+    # Values of columns without a type conversion are not deserialized
+    assert plan.loaders['firstname'].load is None
+    assert plan.loaders['marital_status'].load is not None
+    constructor = 'firstname' in serializer.model_class_parameters
+    assert plan.loaders['firstname'].constructor == constructor
+
+    serialized = {
+        'firstname': 'Sarah',
+        'lastname': 'Kerrigan',
+        'email': 'sarahk@blitz.com',
+        'role': 'Employee',
+        'marital_status': 'MARRIED',
+        'created_at': '2152-01-02T00:00:00',
+    }
+    expected = dict(serialized, marital_status=model.MaritalStatus.MARRIED)
+    del expected['created_at']
+    kwargs, attrs = plan.load(serialized, None, creating=True)
+    assert {**kwargs, **attrs} == expected
+    assert ('firstname' in kwargs) == constructor
+    employee = serializer.load(serialized)
+    assert (employee.firstname, employee.role) == ('Sarah', 'Employee')
+    assert employee.marital_status == model.MaritalStatus.MARRIED
+    assert len(recwarn) == 0
+
+    # Creation only fields are ignored when loading into an existing model
+    with pytest.warns(UserWarning, match="Field 'rank' not defined for Employee"):
+        serializer.load({'role': 'Manager', 'lastname': 'Raynor', 'rank': 1}, employee)
+    assert (employee.lastname, employee.role) == ('Raynor', 'Employee')
+
+    if constructor:
+        # Missing constructor arguments
+        with pytest.raises(Exception, match='Error while trying to create instance of class'):
+            serializer.load({'firstname': 'Sarah'})
+
+
+def test_load_with_custom_create_model(model):
+    created = []
+
+    class EmployeeSerializer(getEmployeeSerializer(model)):
+        def _create_model(self, serialized):
+            created.append(serialized)
+            return model.Employee(
+                firstname=serialized['firstname'].upper(),
+                lastname=serialized['lastname'],
+                email='',
+                role=serialized['role'],
+            )
+
+    serializer = EmployeeSerializer(model.Employee)
+    serialized = {'firstname': 'Sarah', 'lastname': 'Kerrigan', 'role': 'Employee'}
+    employee = serializer.load(serialized)
+    # All loaded values are given to the model creation
+    assert created == [serialized]
+    # Other values are assigned after creation, constructor arguments are not assigned again
+    constructor = 'firstname' in serializer.model_class_parameters
+    assert employee.firstname == ('SARAH' if constructor else 'Sarah')
+    assert employee.lastname == 'Kerrigan'
@@ -0,0 +1,150 @@
+"""
+Columnar dump of models into NumPy arrays, see `ModelSerializer.dump_columns`.
+
+NumPy is an optional dependency of serialchemy, only required by this module.
+"""
+
+import warnings
+from datetime import datetime
+from datetime import timezone
+from enum import Enum
+
+import numpy as np
+
+from .datetime_serializer import DateSerializer
+from .datetime_serializer import DateTimeSerializer
+from .field import DefaultFieldSerializer
+from .field import Field
+
+# NumPy types of the column python types dumped unchanged
+NUMPY_DTYPES = {int: np.dtype('int64'), float: np.dtype('float64'), bool: np.dtype('bool')}
+
+_missing = object()
+
+
+def dump_columns(serializer, models):
+    """
+    Dump models as one NumPy array for each serializer field, in the same order as `dump`.
+
+    :param ModelSerializer serializer: the serializer whose field plan is used
+
+    :param Iterable models: the models to be serialized
+
+    :rtype: Dict[str, numpy.ndarray]
+    """
+    models = list(models)
+    columns = {}
+    for spec in serializer.plan.dump_fields:
+        if spec.model_dump is not None:
+            columns[spec.name] = create_array([spec.model_dump(model) for model in models])
+            continue
+        values = _read_values(models, spec.name)
+        dtype, convert = _get_column_conversion(spec)
+        if convert is not None:
+            values = [None if value is None else convert(value) for value in values]
+        columns[spec.name] = create_array(values, dtype)
+    return columns
+
+
+def transpose_rows(rows):
+    """
+    Convert serialized dicts into one NumPy array for each key. Keys missing on some of the dicts
+    are masked.
+
+    :param List[dict] rows: the serialized models
+
+    :rtype: Dict[str, numpy.ndarray]
+    """
+    names = dict.fromkeys(name for row in rows for name in row)
+    return {name: create_array([row.get(name) for row in rows]) for name in names}
+
+
+def create_array(values, dtype=None):
+    """
+    Create an array from a list of values, None values are masked (a `numpy.ma.MaskedArray` is
+    returned only if there is some None value).
+
+    :param list values: the values
+
+    :param None|numpy.dtype dtype: the array type. If None, numeric types are inferred from the
+        values and `object` is used for any other type
+
+    :rtype: numpy.ndarray
+    """
+    if dtype is None:
+        dtype = _infer_dtype(values)
+    mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    masked = mask.any()
+    if dtype.kind == 'O':
+        array = np.empty(len(values), dtype=object)
+        # Assign one by one, otherwise lists (or other sequences) would be taken as dimensions
+        for index, value in enumerate(values):
+            array[index] = value
+    else:
+        if masked and dtype.kind != 'M':
+            fill = dtype.type(0)
+            values = [fill if value is None else value for value in values]
+        array = np.array(values, dtype=dtype)
+    if masked:
+        return np.ma.MaskedArray(array, mask=mask)
+    return array
+
+
+def _read_values(models, attr):
+    values = [getattr(model, attr, _missing) for model in models]
+    if any(value is _missing for value in values):
+        model = next(model for model, value in zip(models, values) if value is _missing)
+        warnings.warn(f"{model.__class__} does not have attribute '{attr}'")
+        values = [None if value is _missing else value for value in values]
+    return values
+
+
+def _get_column_conversion(spec):
+    """
+    Get the array type of a field and the function converting each (not None) attribute value to
+    an array item.
+
+    :param FieldSpec spec: the dumped field
+
+    :rtype: Tuple[None|numpy.dtype, None|Callable[[Any], Any]]
+    """
+    field = spec.field
+    if spec.identity:
+        return NUMPY_DTYPES.get(spec.model_property.type.python_type, np.dtype(object)), None
+    if type(field).dump is not Field.dump:
+        return None, field.dump
+    serializer = field.serializer
+    if type(serializer) is DefaultFieldSerializer:
+        return None, _get_enum_value
+    dump_implementation = getattr(type(serializer).dump, '__func__', type(serializer).dump)
+    if dump_implementation is DateTimeSerializer.dump.__func__:
+        if isinstance(serializer, DateSerializer):
+            return np.dtype('datetime64[D]'), None
+        return np.dtype('datetime64[us]'), _to_naive_utc
+    return None, serializer.dump
+
+
+def _infer_dtype(values):
+    value_types = {type(value) for value in values if value is not None}
+    if not value_types:
+        return np.dtype(object)
+    if value_types <= {bool}:
+        return NUMPY_DTYPES[bool]
+    if value_types <= {int}:
+        if all(-(2**63) <= value < 2**63 for value in values if value is not None):
+            return NUMPY_DTYPES[int]
+        return np.dtype(object)
+    if value_types <= {int, float}:
+        return NUMPY_DTYPES[float]
+    return np.dtype(object)
+
+
+def _to_naive_utc(value):
+    # NumPy datetimes have no timezone
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _get_enum_value(value):
+    return value.value if isinstance(value, Enum) else value
@@ -1,7 +1,9 @@
+from contextlib import contextmanager
 from typing import Literal
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 
 MappingType = Literal['imperative', 'declarative']
@@ -24,6 +26,39 @@ def get_metadata(mapping_type):
         return Base.metadata
 
 
+@contextmanager
+def record_statements(session):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@pytest.fixture()
+def statements_recorder():
+    """
+    Context manager recording the SQL statements executed by the engine of a session:
+
+    .. code-block:: python
+
+        with statements_recorder(session) as statements:
+            ...
+    """
+    return record_statements
+
+
+@pytest.fixture()
+def metadata(mapping_type: MappingType):
+    return get_metadata(mapping_type)
+
+
 @pytest.fixture(params=['imperative', 'declarative'])
 def mapping_type(request) -> MappingType:
     return request.param
@@ -51,3 +86,37 @@ def db_session(mapping_type: MappingType, engine):
     Session = sessionmaker(bind=engine)
     session = Session()
     yield session
+
+
+@pytest.fixture()
+def seed_employees(model, db_session):
+    """
+    Add 8 employees of all the employee classes, with their company, address, contact and
+    department.
+    """
+    company = model.Company(id=1, name='Terrans', location='Korhal')
+    contact_type = model.ContactType(label='email')
+    department = model.Department(id=1, name='Marines')
+    employee_classes = [model.Employee, model.Engineer, model.Manager, model.SpecialistEngineer]
+    for i in range(1, 9):
+        employee_class = employee_classes[i % len(employee_classes)]
+        employee = employee_class(
+            id=i,
+            firstname=f'First {i}',
+            lastname=f'Last {i}',
+            email='some@email.com',
+            password='somepass',
+            role=employee_class.__mapper__.polymorphic_identity,
+            company=company,
+            address=model.Address(street='5 Av', number=str(i), city='Tarsonis', state='NA'),
+        )
+        employee.departments = [department]
+        if hasattr(model.Contact, 'employee'):
+            db_session.add(
+                model.Contact(type=contact_type, value=f'{i}@email.com', employee=employee)
+            )
+        else:
+            employee.contacts = [model.Contact(type=contact_type, value=f'{i}@email.com')]
+        db_session.add(employee)
+    db_session.commit()
+    db_session.expunge_all()
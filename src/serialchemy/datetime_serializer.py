@@ -1,6 +1,7 @@
 import re
 import warnings
 from datetime import datetime, timedelta, timezone, date
+from functools import lru_cache
 
 from .serializer import Serializer, ColumnSerializer
 
@@ -12,6 +13,10 @@ DATETIME_REGEX = (
     + r"(?P<tz>([\+-]\d{2}:?\d{2})|[Zz])?"
 )
 
+# Lengths of the strings (without offset) parsed by `datetime.fromisoformat` exactly as by
+# DATETIME_REGEX: date, date with hours and minutes, seconds and microseconds
+ISO_FORMAT_LENGTHS = (10, 16, 19, 26)
+
 
 class DateTimeSerializer(Serializer):
     """
@@ -26,6 +31,75 @@ class DateTimeSerializer(Serializer):
 
     @classmethod
     def load(cls, serialized, session=None):
+        dt = cls._load_iso_format(serialized)
+        if dt is None:
+            dt = cls._load_lenient(serialized)
+        return dt
+
+    @classmethod
+    def load_many(cls, serialized_values, session=None):
+        """
+        Deserialize each of the given strings.
+
+        :param Iterable[str] serialized_values: the serialized values
+
+        :rtype: list
+        """
+        load = cls.load
+        return [load(serialized) for serialized in serialized_values]
+
+    @classmethod
+    def _load_iso_format(cls, serialized):
+        """
+        Parse strings in the format written by `datetime.isoformat` using `datetime.fromisoformat`.
+
+        :return: the parsed datetime, or None if `serialized` must be parsed by `_load_lenient`
+        :rtype: None|datetime
+        """
+        end = len(serialized)
+        offset_str = None
+        if end > 16:
+            if serialized[-1] in 'Zz':
+                offset_str = serialized[-1]
+                end -= 1
+            elif serialized[-6] in '+-' and serialized[-3] == ':':
+                offset_str = serialized[-6:]
+                if not (offset_str[1:3] + offset_str[4:]).isdigit():
+                    return None
+                # The lenient parser reads negative offsets with hours and minutes as -HH+MM
+                if offset_str[0] == '-' and offset_str[1:3] != '00' and offset_str[4:] != '00':
+                    return None
+                end -= 6
+        if end not in ISO_FORMAT_LENGTHS or serialized[4] != '-' or serialized[7] != '-':
+            return None
+        # `fromisoformat` also accepts offsets without ':' and other formats, so all the parts
+        # of the string must be checked to parse it as the lenient parser does
+        digits = serialized[:4] + serialized[5:7] + serialized[8:10]
+        if end > 10:
+            if serialized[10] not in 'T ' or serialized[13] != ':':
+                return None
+            digits += serialized[11:13] + serialized[14:16]
+        if end > 16:
+            if serialized[16] != ':':
+                return None
+            digits += serialized[17:19]
+        if end > 19:
+            if serialized[19] != '.':
+                return None
+            digits += serialized[20:end]
+        if not digits.isdigit():
+            return None
+        try:
+            dt = datetime.fromisoformat(serialized[:end])
+        except ValueError:
+            return None
+        if offset_str is not None:
+            # Faster than `replace(tzinfo=...)`
+            dt = datetime.combine(dt, dt.time(), _get_timezone(offset_str))
+        return dt
+
+    @classmethod
+    def _load_lenient(cls, serialized):
         match = cls.DATETIME_RE.match(serialized)
         if not match:
             raise ValueError("Could not parse DateTime: '{}'".format(serialized))
@@ -46,20 +120,34 @@ class DateTimeSerializer(Serializer):
     def _parse_tzinfo(offset_str):
         if not offset_str:
             return None
-        elif offset_str.upper() == 'Z':
-            return timezone.utc
-        else:
-            hours = int(offset_str[:3])
-            minutes = int(offset_str[-2:])
-            # Invert minutes sign if hours == 0
-            if offset_str[0] == "-" and hours == 0:
-                minutes = -minutes
-            return timezone(timedelta(hours=hours, minutes=minutes))
+        return _get_timezone(offset_str)
+
+
+@lru_cache(maxsize=256)
+def _get_timezone(offset_str):
+    """
+    Get the timezone of an offset string, timezones are cached to be shared by parsed values.
+
+    :rtype: timezone
+    """
+    if offset_str.upper() == 'Z':
+        return timezone.utc
+    hours = int(offset_str[:3])
+    minutes = int(offset_str[-2:])
+    # Invert minutes sign if hours == 0
+    if offset_str[0] == "-" and hours == 0:
+        minutes = -minutes
+    return timezone(timedelta(hours=hours, minutes=minutes))
 
 
 class DateSerializer(DateTimeSerializer):
     @classmethod
     def load(cls, serialized, session=None):
+        if len(serialized) == 10 and serialized[4] == '-' and serialized[7] == '-':
+            try:
+                return date.fromisoformat(serialized)
+            except ValueError:
+                pass
         dt = super().load(serialized, session)
         if dt.hour or dt.minute or dt.second:
             warnings.warn(
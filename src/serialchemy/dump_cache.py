@@ -0,0 +1,250 @@
+"""
+Cache of dumped models, kept up to date by SQLAlchemy events. See `DumpCache`.
+"""
+
+import threading
+import weakref
+from collections import namedtuple
+from collections import OrderedDict
+from itertools import chain
+from typing import Set
+
+from sqlalchemy import event
+from sqlalchemy import inspect
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm import MANYTOONE
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.base import instance_state
+
+from .dump_context import _current_context
+from .dump_context import DumpContext
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# Key of the change counter on `InstanceState.info`
+CHANGES_INFO_KEY = 'serialchemy_changes'
+
+# Key of the identity keys flushed on the current transaction on `Session.info`
+FLUSHED_INFO_KEY = 'serialchemy_flushed'
+
+_caches: 'weakref.WeakSet[DumpCache]' = weakref.WeakSet()
+_listened_classes: Set[type] = set()
+_listen_lock = threading.Lock()
+_listening_sessions = False
+
+
+class DumpCache(object):
+    """
+    Thread-safe LRU cache of dumped models, keyed by serializer, identity key and version:
+
+    .. code-block:: python
+
+        cache = DumpCache(maxsize=10000)
+        serializer = ModelSerializer(Employee, dump_cache=cache)
+        serializer.dump_many(session.query(Employee))  # dumped models are cached
+
+    The version is the value of the `version_id_col` of the model mapper if mapped, otherwise
+    a change counter of the model instance. Cached dumps are invalidated whenever the model, or
+    a model nested in it by `NestedModelField` or `NestedModelListField`, is changed: attributes
+    set, appended or removed, and models flushed, committed or rolled back.
+
+    Only changes made through sessions of this process are seen, unless a `version_id_col` is
+    mapped (which covers the dumped model, but not its nested models). Changes of foreign key
+    columns are not seen by the models on the other side of the relationship, unless the
+    relationship itself is set. Models with pending changes or without an identity (not
+    persisted yet) are not cached.
+
+    Cached dicts are shared by all dumps of the same model version and should not be changed.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        # Cache key -> serialized model and the identity keys of its nested models
+        self._entries = OrderedDict()
+        # Identity key -> keys of the entries of the model or of models nesting it
+        self._keys = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        _listen_sessions()
+        _caches.add(self)
+
+    def dump(self, serializer, model, dump):
+        """
+        Get the cached dump of a model, calling `dump` on a cache miss.
+
+        :param ModelSerializer serializer: the serializer of the model
+
+        :param DeclarativeMeta model: the model to be serialized
+
+        :param Callable[[DeclarativeMeta], dict] dump: dumps the model with the serializer fields
+
+        :rtype: dict
+        """
+        state = instance_state(model)
+        identity_key = state.identity_key
+        if identity_key is None or state.modified:
+            return dump(model)
+        key = (serializer, identity_key, _get_version(state, model))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+
+        _listen_class(model.__class__)
+        recorder = _NestedModelsRecorder()
+        token = _current_context.set(recorder)
+        try:
+            serialized = dump(model)
+        finally:
+            _current_context.reset(token)
+        if recorder.cacheable:
+            self._add(key, serialized, recorder.identity_keys)
+        return serialized
+
+    def _add(self, key, serialized, nested_identity_keys):
+        with self._lock:
+            self._entries[key] = (serialized, nested_identity_keys)
+            for identity_key in chain((key[1],), nested_identity_keys):
+                self._keys.setdefault(identity_key, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove(*self._entries.popitem(last=False))
+
+    def _remove(self, key, entry):
+        for identity_key in chain((key[1],), entry[1]):
+            keys = self._keys.get(identity_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys[identity_key]
+
+    def invalidate(self, identity_key):
+        """
+        Remove the cached dumps of the model with the given identity key, and of the models
+        nesting it.
+
+        :param tuple identity_key: the identity key of the model
+        """
+        with self._lock:
+            for key in self._keys.pop(identity_key, ()):
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._remove(key, entry)
+
+    def cache_info(self):
+        """
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+class _NestedModelsRecorder(DumpContext):
+    """
+    Collects the identity keys of the nested models dumped along with a cached model.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.identity_keys = set()
+        self.cacheable = True
+
+    def _dump(self, serializer, dump, model, top_level=False):
+        state = instance_state(model)
+        if state.identity_key is None or state.modified:
+            # Changes of the nested model would not invalidate the dump
+            self.cacheable = False
+        else:
+            self.identity_keys.add(state.identity_key)
+            _listen_class(model.__class__)
+        return super()._dump(serializer, dump, model, top_level)
+
+
+def _get_version(state, model):
+    version_id_col = state.mapper.version_id_col
+    if version_id_col is not None:
+        return getattr(model, state.mapper.get_property_by_column(version_id_col).key)
+    return state.info.get(CHANGES_INFO_KEY, 0)
+
+
+def _invalidate(state):
+    state.info[CHANGES_INFO_KEY] = state.info.get(CHANGES_INFO_KEY, 0) + 1
+    identity_key = state.identity_key
+    if identity_key is not None:
+        for cache in list(_caches):
+            cache.invalidate(identity_key)
+
+
+def _on_attribute_change(target, *args):
+    if _caches:
+        _invalidate(instance_state(target))
+
+
+def _listen_class(model_class):
+    """
+    Listen to changes of the attributes of models of the given class.
+    """
+    if model_class in _listened_classes:
+        return
+    with _listen_lock:
+        if model_class in _listened_classes:
+            return
+        for prop in inspect(model_class).attrs:
+            if isinstance(prop, (ColumnProperty, RelationshipProperty)):
+                attribute = getattr(model_class, prop.key)
+                for identifier in ('set', 'append', 'remove'):
+                    event.listen(attribute, identifier, _on_attribute_change)
+        _listened_classes.add(model_class)
+
+
+def _listen_sessions():
+    """
+    Listen to the flushes and transactions of all sessions, once a cache is created.
+    """
+    global _listening_sessions
+    if _listening_sessions:
+        return
+    with _listen_lock:
+        if _listening_sessions:
+            return
+        event.listen(Session, 'after_flush', _invalidate_flushed)
+        event.listen(Session, 'after_commit', _invalidate_transaction)
+        event.listen(Session, 'after_rollback', _invalidate_transaction)
+        _listening_sessions = True
+
+
+def _invalidate_flushed(session, flush_context):
+    if not _caches:
+        return
+    flushed = session.info.setdefault(FLUSHED_INFO_KEY, set())
+    for model in chain(session.new, session.dirty, session.deleted):
+        state = instance_state(model)
+        # Models on the other side of many-to-one relationships (like the employee of a new
+        # contact) may have a collection of flushed models
+        for prop in state.mapper.relationships:
+            if prop.direction is MANYTOONE:
+                for related in state.attrs[prop.key].history.sum():
+                    if related is not None:
+                        _invalidate(instance_state(related))
+        _invalidate(state)
+        if state.identity_key is not None:
+            flushed.add(state.identity_key)
+
+
+def _invalidate_transaction(session):
+    # Models may be dumped after a flush, before the transaction ends
+    flushed = session.info.pop(FLUSHED_INFO_KEY, ())
+    for identity_key in flushed:
+        for cache in list(_caches):
+            cache.invalidate(identity_key)
@@ -0,0 +1,178 @@
+import keyword
+from enum import Enum
+
+from .datetime_serializer import DateTimeSerializer
+from .enum_serializer import EnumKeySerializer
+from .enum_serializer import EnumSerializer
+from .field import DefaultFieldSerializer
+from .field import Field
+from .json_encoder import encode_basestring_ascii
+from .json_encoder import encode_float
+from .json_encoder import encode_list
+from .json_encoder import encode_value
+
+
+def compile_dump(serializer):
+    """
+    Generate a function specialized in dumping models of the given serializer.
+
+    The generated function produces exactly the same output as `ModelSerializer.dump`, but
+    without walking the serializer fields on each call: load-only fields are removed, the field
+    converters are bound directly and fields that do not need any conversion are plain attribute
+    reads.
+
+    If some attribute is missing on the dumped model the generic `dump` implementation is used
+    instead, so the same warnings are issued.
+
+    :param ModelSerializer serializer: the serializer to compile
+
+    :rtype: Callable[[object], dict]
+    """
+    namespace = {'Enum': Enum, 'fallback': serializer._dump_model}
+    reads = []
+    items = []
+    for index, spec in enumerate(serializer.plan.dump_fields):
+        attr, field = spec.name, spec.field
+        var = f'v{index}'
+        if spec.model_dump is not None:
+            namespace[f'm{index}'] = spec.model_dump
+            items.append(f'        {attr!r}: m{index}(model),')
+            continue
+        reads.append(_read_attribute(var, attr))
+        if spec.identity:
+            expression = var
+        elif type(field).dump is not Field.dump:
+            namespace[f'f{index}'] = field.dump
+            expression = f'f{index}({var})'
+        elif type(field.serializer) is DefaultFieldSerializer:
+            expression = (
+                f'None if {var} is None else ({var}.value if isinstance({var}, Enum) else {var})'
+            )
+        else:
+            namespace[f'd{index}'] = field.serializer.dump
+            expression = f'None if {var} is None else d{index}({var})'
+        items.append(f'        {attr!r}: {expression},')
+    items.append('    }')
+
+    return _create_function(f'dump_{serializer.get_model_name()}', reads, ['{', *items], namespace)
+
+
+def compile_json_dump(serializer):
+    """
+    Generate a function that encodes models of the given serializer directly as JSON.
+
+    The generated function returns the same as `json.dumps(serializer.dump(model),
+    separators=JSON_SEPARATORS)`, but without creating the serialized dict: values of columns,
+    dates, enums and nested models are encoded inline. Fields with custom serializers are encoded
+    from the output of their `dump`.
+
+    :param ModelSerializer serializer: the serializer to compile
+
+    :rtype: Callable[[object], str]
+    """
+    namespace = {
+        'Enum': Enum,
+        'encode': encode_value,
+        'encode_str': encode_basestring_ascii,
+        'encode_int': int.__repr__,
+        'encode_float': encode_float,
+        'encode_list': encode_list,
+        'fallback': lambda model: encode_value(serializer._dump_model(model)),
+    }
+    reads = []
+    parts = []
+    for index, spec in enumerate(serializer.plan.dump_fields):
+        var = f'v{index}'
+        separator = ',' if parts else '{'
+        parts.append(f'        {separator + encode_basestring_ascii(spec.name) + ":"!r},')
+        if spec.model_dump is not None:
+            namespace[f'm{index}'] = spec.model_dump
+            parts.append(f'        encode(m{index}(model)),')
+            continue
+        reads.append(_read_attribute(var, spec.name))
+        parts.append(f'        {_get_json_expression(spec, var, index, namespace)},')
+
+    return _create_function(
+        f'dump_json_{serializer.get_model_name()}',
+        reads,
+        ["''.join((", *parts, "        '}',", "    ))"] if parts else ["'{}'"],
+        namespace,
+    )
+
+
+def _get_json_expression(spec, var, index, namespace):
+    from .nested_fields import NestedModelField
+    from .nested_fields import NestedModelListField
+
+    field = spec.field
+    serializer = field.serializer
+    if spec.identity:
+        python_type = spec.model_property.type.python_type
+        for type_, encoder in ((str, 'encode_str'), (int, 'encode_int'), (float, 'encode_float')):
+            if python_type is type_:
+                return f'{encoder}({var}) if {var}.__class__ is {type_.__name__} else encode({var})'
+        return f'encode({var})'
+
+    nested_json_function = getattr(serializer, '_get_json_function', None)
+    if type(field).dump is not Field.dump:
+        # Nested models are encoded inline, `DumpContext` only applies to dumped dicts
+        if type(field).dump is NestedModelListField.dump and nested_json_function is not None:
+            namespace[f'n{index}'] = nested_json_function()
+            return f"'[]' if {var} is None else encode_list({var}, n{index})"
+        if type(field).dump is NestedModelField.dump and nested_json_function is not None:
+            namespace[f'n{index}'] = nested_json_function()
+            return f"'null' if {var} is None else n{index}({var})"
+        namespace[f'f{index}'] = field.dump
+        return f'encode(f{index}({var}))'
+
+    dump_implementation = _get_function(type(serializer).dump)
+    if type(serializer) is DefaultFieldSerializer:
+        return f'encode({var}.value if isinstance({var}, Enum) else {var})'
+    elif dump_implementation is _get_function(DateTimeSerializer.dump):
+        return f"""'null' if {var} is None else '"' + {var}.isoformat() + '"'"""
+    elif dump_implementation is EnumSerializer.dump:
+        return f"'null' if not {var} else encode({var}.value)"
+    elif dump_implementation is EnumKeySerializer.dump:
+        return f"'null' if not {var} else encode_str({var}.name)"
+    elif nested_json_function is not None:
+        namespace[f'n{index}'] = nested_json_function()
+        return f"'null' if {var} is None else n{index}({var})"
+    namespace[f'd{index}'] = serializer.dump
+    return f"'null' if {var} is None else encode(d{index}({var}))"
+
+
+def _get_function(method):
+    return getattr(method, '__func__', method)
+
+
+def _read_attribute(var, attr):
+    if attr.isidentifier() and not keyword.iskeyword(attr):
+        return f'        {var} = model.{attr}'
+    return f'        {var} = getattr(model, {attr!r})'
+
+
+def _create_function(function_name, reads, returned, namespace):
+    """
+    :param str function_name: the generated function name
+
+    :param List[str] reads: statements reading the model attributes
+
+    :param List[str] returned: lines of the returned expression
+
+    :param dict namespace: globals of the generated function, `fallback` is called when some
+        model attribute is missing
+
+    :rtype: Callable[[object], Any]
+    """
+    lines = [f'def {function_name}(model):']
+    if reads:
+        lines += [
+            '    try:',
+            *reads,
+            '    except AttributeError:',
+            '        return fallback(model)',
+        ]
+    lines += [f'    return {returned[0]}', *returned[1:]]
+    source = '\n'.join(lines)
+    exec(compile(source, f'<serialchemy {function_name}>', 'exec'), namespace)
+    return namespace[function_name]
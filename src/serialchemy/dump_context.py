@@ -0,0 +1,146 @@
+"""
+Graph-aware dump of models, see `DumpContext`.
+"""
+
+from contextvars import ContextVar
+
+from sqlalchemy.orm.base import instance_state
+
+_current_context = ContextVar('serialchemy_dump_context', default=None)
+
+
+def get_dump_context():
+    """
+    Get the context of the running `ModelSerializer.dump` (or `dump_many`) call.
+
+    :rtype: None|DumpContext
+    """
+    return _current_context.get()
+
+
+class DumpContext(object):
+    """
+    State shared by the nested models dumped by a single `dump` or `dump_many` call:
+
+    .. code-block:: python
+
+        serializer.dump_many(employees, context=DumpContext(refs=True, max_depth=3))
+
+    * Nested models are memoized by serializer and identity key, so a model referenced many
+      times (like the company of many employees) is dumped once. Repeats are the same dict, or
+      a `{"$ref": ...}` when `refs` is True. The first occurrence of a referenced model gets
+      the same value as its `"$id"`, like `{"id": 5, ..., "$id": "Company:5"}`;
+    * Models nested deeper than `max_depth` are dumped as their primary key (like
+      `{"id": 5}`);
+    * A model nested in itself (a cycle) is dumped as a `{"$ref": ...}` when `refs` is True,
+      otherwise a `ValueError` is raised.
+
+    Only models dumped by `NestedModelField` and `NestedModelListField` are affected. A context
+    keeps the dumped dicts and should not be reused between calls.
+    """
+
+    REF_KEY = '$ref'
+    ID_KEY = '$id'
+
+    def __init__(self, refs=False, max_depth=None):
+        """
+        :param bool refs: If True, repeated models are dumped as references to their first
+            occurrence
+
+        :param None|int max_depth: the maximum depth of dumped nested models, the models passed to
+            `dump` have depth 0
+        """
+        self.refs = refs
+        self.max_depth = max_depth
+        # Number of models dumped from the memo
+        self.hits = 0
+        self._memo = {}
+        self._path = set()
+        # Models referenced by a cycle while being dumped
+        self._cycle_targets = set()
+        self._depth = 0
+        self._dump_functions = {}
+
+    def dump_many(self, serializer, models):
+        """
+        Dump models with this context, see `ModelSerializer.dump_many`.
+
+        :rtype: List[dict]
+        """
+        token = _current_context.set(self)
+        try:
+            dump = self._get_dump_function(serializer)
+            return [self._dump(serializer, dump, model, top_level=True) for model in models]
+        finally:
+            _current_context.reset(token)
+
+    def dump_nested(self, serializer, model):
+        """
+        Dump a model nested in a model being dumped.
+
+        :param ModelSerializer serializer: the serializer of the nested field
+
+        :param DeclarativeMeta model: the nested model, not None
+
+        :rtype: dict
+        """
+        if self.max_depth is not None and self._depth >= self.max_depth:
+            return _dump_primary_key(serializer, model)
+        self._depth += 1
+        try:
+            return self._dump(serializer, self._get_dump_function(serializer), model)
+        finally:
+            self._depth -= 1
+
+    def _dump(self, serializer, dump, model, top_level=False):
+        state = instance_state(model)
+        identity_key = state.identity_key
+        if identity_key is not None:
+            serialized = self._memo.get((serializer, identity_key))
+            if serialized is not None:
+                self.hits += 1
+                if self.refs and not top_level:
+                    ref = serialized.get(self.ID_KEY)
+                    if ref is None:
+                        ref = serialized[self.ID_KEY] = _get_ref(identity_key)
+                    return {self.REF_KEY: ref}
+                return serialized
+
+        if state in self._path:
+            if self.refs and identity_key is not None:
+                self._cycle_targets.add(state)
+                return {self.REF_KEY: _get_ref(identity_key)}
+            raise ValueError(f'Cycle detected dumping {model!r}: the model is nested in itself')
+        self._path.add(state)
+        try:
+            serialized = dump(model)
+        finally:
+            self._path.discard(state)
+
+        if identity_key is not None:
+            if state in self._cycle_targets:
+                serialized[self.ID_KEY] = _get_ref(identity_key)
+            self._memo[serializer, identity_key] = serialized
+        return serialized
+
+    def _get_dump_function(self, serializer):
+        dump = self._dump_functions.get(serializer)
+        if dump is None:
+            dump = self._dump_functions[serializer] = serializer._get_dump_function()
+        return dump
+
+
+def _get_ref(identity_key):
+    """
+    :param tuple identity_key: the identity key of a model, like `(Company, (5,), None)`
+
+    :rtype: str
+    """
+    model_class, pk, _ = identity_key
+    return f"{model_class.__name__}:{','.join(map(str, pk))}"
+
+
+def _dump_primary_key(serializer, model):
+    mapper = serializer.mapper
+    keys = [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+    return {key: getattr(model, key) for key in keys}
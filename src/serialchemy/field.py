@@ -21,6 +21,9 @@ class Field(object):
     Configure a ModelSerializer field
     """
 
+    # If True, `load` is called with the session given to `ModelSerializer.load`
+    session_based = False
+
     def __init__(self, dump_only=False, load_only=False, creation_only=False, serializer=None):
         """
         :param bool dump_only: If True, field is not included on deserialization.
@@ -55,3 +58,37 @@ class Field(object):
         if serialized is None:
             return None
         return self.serializer.load(serialized, **kw)
+
+    def get_loader_option(self, relationship):
+        """
+        Get the loader option for the model relationship dumped by this field, see
+        `ModelSerializer.loader_options`.
+
+        :param RelationshipProperty relationship: the relationship with the same name as the field
+
+        :rtype: None|LoaderOption
+        """
+        return None
+
+    def dump_changes(self, value):
+        """
+        Dump the changes made inside a value that was not replaced, like the changed attributes
+        of a nested model. See `ModelSerializer.dump_changes`.
+
+        :param value: the unchanged attribute value, already loaded
+
+        :return: the dumped changes, None if there are no changes
+        """
+        return None
+
+    def get_model_dump(self, relationship):
+        """
+        Get a function that dumps the model relationship with the same name as the field straight
+        from the model, instead of dumping the relationship value. Allows fields to dump a
+        relationship without loading it.
+
+        :param RelationshipProperty relationship: the relationship with the same name as the field
+
+        :rtype: None|Callable[[object], Any]
+        """
+        return None
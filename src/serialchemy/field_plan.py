@@ -0,0 +1,101 @@
+import copy
+from decimal import Decimal
+from enum import Enum
+from types import MappingProxyType
+from typing import Any
+from typing import Callable
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from sqlalchemy import Column
+from sqlalchemy.types import TypeDecorator
+
+from .field import DefaultFieldSerializer
+from .field import Field
+
+# Python types returned by column types that `DefaultFieldSerializer` dumps unchanged
+IDENTITY_PYTHON_TYPES = (int, float, str, bool, bytes, Decimal)
+
+
+class FieldSpec(NamedTuple):
+    """
+    A serializer field with its serializer resolved for the model property it is bound to.
+    """
+
+    name: str
+    field: Field
+    model_property: Optional[Any]
+    identity: bool
+    model_dump: Optional[Callable[[Any], Any]] = None
+
+
+class FieldPlan(NamedTuple):
+    """
+    Immutable set of fields used by a `ModelSerializer`, resolved once on construction.
+    """
+
+    fields: Tuple[FieldSpec, ...]
+    dump_fields: Tuple[FieldSpec, ...]
+    by_name: Mapping[str, FieldSpec]
+
+    @classmethod
+    def create(cls, specs):
+        """
+        :param Iterable[FieldSpec] specs: the resolved fields, in serialization order
+
+        :rtype: FieldPlan
+        """
+        specs = tuple(specs)
+        return cls(
+            fields=specs,
+            dump_fields=tuple(spec for spec in specs if not spec.field.load_only),
+            by_name=MappingProxyType({spec.name: spec for spec in specs}),
+        )
+
+
+def create_field_spec(name, field, model_property, default_serializer=None, relationship=None):
+    """
+    :param str name: the field name
+
+    :param Field field: the field declared on (or created by) the serializer
+
+    :param model_property: the model column or composite bound to the field, if any
+
+    :param None|Serializer default_serializer: serializer to be used when `field` has none
+
+    :param None|RelationshipProperty relationship: the model relationship with the field name, if
+        any
+
+    :rtype: FieldSpec
+    """
+    if default_serializer is not None and isinstance(field.serializer, DefaultFieldSerializer):
+        # Fields may be shared by many serializers, so the resolved serializer is set on a copy
+        field = copy.copy(field)
+        field._serializer = default_serializer
+    model_dump = field.get_model_dump(relationship) if relationship is not None else None
+    return FieldSpec(
+        name, field, model_property, is_identity_field(field, model_property), model_dump
+    )
+
+
+def is_identity_field(field, model_property):
+    """
+    Check if the field dumps the model attribute value unchanged.
+
+    :param Field field: the serializer field
+
+    :param model_property: the model column or composite bound to the field, if any
+
+    :rtype: bool
+    """
+    if type(field).dump is not Field.dump or type(field.serializer) is not DefaultFieldSerializer:
+        return False
+    if not isinstance(model_property, Column) or isinstance(model_property.type, TypeDecorator):
+        return False
+    try:
+        python_type = model_property.type.python_type
+    except NotImplementedError:
+        return False
+    return issubclass(python_type, IDENTITY_PYTHON_TYPES) and not issubclass(python_type, Enum)
@@ -1,7 +1,111 @@
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
 from serialchemy import ModelSerializer
+from serialchemy.dump_cache import CacheInfo
+
+
+class SerializerCache(object):
+    """
+    Thread-safe LRU cache of serializers, keyed by model class, nest_foreign_keys and serializer
+    class.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._serializers = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, model_class, nest_foreign_keys=False, serializer_class=ModelSerializer):
+        """
+        Get a cached serializer, creating it on a cache miss.
+
+        :rtype: ModelSerializer
+        """
+        key = (model_class, nest_foreign_keys, serializer_class)
+        with self._lock:
+            serializer = self._serializers.get(key)
+            if serializer is not None:
+                self._serializers.move_to_end(key)
+                self._hits += 1
+                return serializer
+            self._misses += 1
+
+        # Serializer is created outside the lock, at worst it is created more than once
+        if nest_foreign_keys:
+            serializer = serializer_class(model_class, nest_foreign_keys=True)
+        else:
+            serializer = serializer_class(model_class)
+        with self._lock:
+            serializer = self._serializers.setdefault(key, serializer)
+            self._serializers.move_to_end(key)
+            while len(self._serializers) > self.maxsize:
+                self._serializers.popitem(last=False)
+        return serializer
+
+    def cache_info(self):
+        """
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._serializers))
+
+    def clear(self):
+        with self._lock:
+            self._serializers.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_serializer_cache = SerializerCache()
+
+
+@event.listens_for(Mapper, 'after_configured')
+def _clear_after_mappers_configured():
+    # New or changed mappings may change the fields of the cached serializers
+    _serializer_cache.clear()
+
+
+def get_serializer(model_class, nest_foreign_keys=False, serializer_class=ModelSerializer):
+    """
+    Get a serializer for the given model class, shared by all callers.
 
+    Serializers are cached (see `serializer_cache_info` and `clear_serializer_cache`), the cache
+    is cleared automatically whenever SQLAlchemy mappers are configured.
 
-def dump(model, nest_foreign_keys=False):
+    :param model_class: the SQLAlchemy model class.
+    :type model_class: Type[sqlalchemy.ext.declarative.DeclarativeMeta]
+
+    :param bool nest_foreign_keys: If True, serialize any foreign key column as a nested object.
+
+    :param Type[ModelSerializer] serializer_class: the serializer class.
+
+    :rtype: ModelSerializer
+    """
+    return _serializer_cache.get(model_class, nest_foreign_keys, serializer_class)
+
+
+def serializer_cache_info():
+    """
+    :rtype: CacheInfo
+    """
+    return _serializer_cache.cache_info()
+
+
+def clear_serializer_cache():
+    """
+    Clear the serializers cache. Should be called when the mappings of cached model classes are
+    changed.
+    """
+    _serializer_cache.clear()
+
+
+def dump(model, nest_foreign_keys=False, serializer_class=ModelSerializer):
     """
     Serialize a SQLAlchemy model.
 
@@ -10,13 +114,15 @@ def dump(model, nest_foreign_keys=False):
 
     :param bool nest_foreign_keys: If True, serialize any foreign key column as a nested object.
 
+    :param Type[ModelSerializer] serializer_class: the serializer class.
+
     :rtype: dict
     """
-    serializer = ModelSerializer(model.__class__, nest_foreign_keys=nest_foreign_keys)
+    serializer = get_serializer(model.__class__, nest_foreign_keys, serializer_class)
     return serializer.dump(model)
 
 
-def load(serialized, model_class, nest_foreign_keys=False):
+def load(serialized, model_class, nest_foreign_keys=False, serializer_class=ModelSerializer):
     """
     Deserialize a dict into a SQLAlchemy model.
 
@@ -27,7 +133,9 @@ def load(serialized, model_class, nest_foreign_keys=False):
 
     :param bool nest_foreign_keys: If True, serialized content has foreign keys as nested object.
 
+    :param Type[ModelSerializer] serializer_class: the serializer class.
+
     :rtype: model_class
     """
-    serializer = ModelSerializer(model_class, nest_foreign_keys=nest_foreign_keys)
+    serializer = get_serializer(model_class, nest_foreign_keys, serializer_class)
     return serializer.load(serialized)
@@ -0,0 +1,65 @@
+import json
+from json.encoder import py_encode_basestring_ascii
+from typing import Callable
+
+# The (C accelerated, if available) string encoder used by `json.dumps`, not declared by the
+# typing stubs of `json.encoder`
+encode_basestring_ascii: Callable[[str], str] = getattr(
+    json.encoder, 'encode_basestring_ascii', py_encode_basestring_ascii
+)
+
+# Same output format used by all JSON dumps
+JSON_SEPARATORS = (',', ':')
+
+_json_encoder = json.JSONEncoder(separators=JSON_SEPARATORS)
+
+
+def encode_float(value):
+    """
+    Encode a float exactly as `json.dumps` does.
+
+    :param float value: the float to be encoded
+
+    :rtype: str
+    """
+    if value != value:
+        return 'NaN'
+    elif value == float('inf'):
+        return 'Infinity'
+    elif value == -float('inf'):
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+_VALUE_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: encode_float,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+}
+
+
+def encode_value(value):
+    """
+    Encode a serialized value as JSON, same as `json.dumps(value, separators=JSON_SEPARATORS)`.
+
+    :param value: a JSON serializable value
+
+    :rtype: str
+    """
+    encoder = _VALUE_ENCODERS.get(value.__class__)
+    if encoder is None:
+        return _json_encoder.encode(value)
+    return encoder(value)
+
+
+def encode_list(values, encode_item):
+    """
+    :param Iterable values: the items to be encoded
+
+    :param Callable[[Any], str] encode_item: encode a single item as JSON
+
+    :rtype: str
+    """
+    return '[' + ','.join(map(encode_item, values)) + ']'
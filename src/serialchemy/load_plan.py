@@ -0,0 +1,104 @@
+import warnings
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+
+from .field import DefaultFieldSerializer
+from .field import Field
+
+
+class FieldLoader(NamedTuple):
+    """
+    How a serialized value is loaded and assigned to a model, resolved once for each field.
+    """
+
+    # Deserializes the value, None if the value is assigned unchanged
+    load: Optional[Callable[..., Any]]
+    session_based: bool
+    creation_only: bool
+    # If True, the value is passed to the model constructor when creating a model
+    constructor: bool
+
+
+class LoadPlan(object):
+    """
+    Load plan of a `ModelSerializer`: the loader of each loaded field, partitioned in constructor
+    arguments, attributes assigned after construction and session based fields.
+    """
+
+    def __init__(self, serializer):
+        """
+        :param ModelSerializer serializer: the serializer whose field plan is used
+        """
+        self.model_name = serializer.model_class.__name__
+        constructor_parameters = serializer.model_class_parameters
+        self.loaders = {}
+        self.session_fields = []
+        # Fields silently ignored by `load`
+        self.dump_only_names = frozenset(
+            spec.name for spec in serializer.plan.fields if spec.field.dump_only
+        )
+        for spec in serializer.plan.fields:
+            field = spec.field
+            if field.dump_only:
+                continue
+            if field.session_based:
+                self.session_fields.append((spec.name, field))
+            self.loaders[spec.name] = FieldLoader(
+                load=None if _is_identity_load(field) else field.load,
+                session_based=field.session_based,
+                creation_only=field.creation_only,
+                constructor=spec.name in constructor_parameters,
+            )
+
+    def load(self, serialized, session, creating):
+        """
+        Deserialize the values of a serialized dict in a single pass over its keys.
+
+        :param dict serialized: the serialized object
+
+        :param None|Session session: passed to session based fields
+
+        :param bool creating: If True, the values are loaded into a new model: creation only
+            fields are loaded and constructor arguments are split from the other attributes
+
+        :return: the constructor arguments and the attributes to be assigned, in the order of the
+            serialized keys
+        :rtype: Tuple[Dict[str, Any], Dict[str, Any]]
+        """
+        kwargs = {}
+        attrs = {}
+        loaders = self.loaders
+        for name, value in serialized.items():
+            loader = loaders.get(name)
+            if loader is None:
+                if name not in self.dump_only_names:
+                    warnings.warn(f"Field '{name}' not defined for {self.model_name}")
+                continue
+            load, session_based, creation_only, constructor = loader
+            if creation_only and not creating:
+                continue
+            if session_based:
+                value = load(value, session=session)
+            elif load is not None:
+                value = load(value)
+            if constructor and creating:
+                kwargs[name] = value
+            else:
+                attrs[name] = value
+        return kwargs, attrs
+
+
+def _is_identity_load(field):
+    """
+    Check if the field loads serialized values unchanged.
+
+    :param Field field: the serializer field
+
+    :rtype: bool
+    """
+    return (
+        type(field).load is Field.load
+        and type(field.serializer).load is DefaultFieldSerializer.load
+    )
@@ -1,21 +1,47 @@
+import copy
 import inspect
+import operator
+import os
 import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import cached_property
+from itertools import islice
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Type
 
 from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm import CompositeProperty
+from sqlalchemy.orm import defer
 from sqlalchemy.orm import Mapper
+from sqlalchemy.orm import Query
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm import undefer
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.orm.attributes import PASSIVE_NO_INITIALIZE
+from sqlalchemy.orm.base import instance_state
 
-from .datetime_serializer import DateColumnSerializer
-from .datetime_serializer import DateTimeColumnSerializer
-from .field import DefaultFieldSerializer
+from .dump_compiler import compile_dump
+from .dump_compiler import compile_json_dump
 from .field import Field
+from .field_plan import create_field_spec
+from .field_plan import FieldPlan
+from .json_encoder import encode_list
+from .json_encoder import encode_value
+from .load_plan import LoadPlan
+from .projection import get_projection_key
+from .projection import parse_field_paths
+from .projection import ProjectionCache
+from .projection import to_field_paths
+from .row_plan import RowPlan
+from .serializer import ColumnSerializer
 from .serializer import Serializer
-from serialchemy.enum_serializer import EnumSerializer
-from serialchemy.serializer_checks import is_date_column
-from serialchemy.serializer_checks import is_datetime_column
-from serialchemy.serializer_checks import is_enum_column
+from .serializer_registry import create_default_registry
 
 
 class ModelSerializer(Serializer):
@@ -25,20 +51,46 @@ class ModelSerializer(Serializer):
 
     _class_mapper: Mapper
 
-    EXTRA_SERIALIZERS = [
-        (DateTimeColumnSerializer, is_datetime_column),
-        (DateColumnSerializer, is_date_column),
-        (EnumSerializer, is_enum_column),
-    ]
+    # Default serializers for columns, by column type
+    COLUMN_SERIALIZERS = create_default_registry()
 
-    def __init__(self, model_class, nest_foreign_keys=False):
+    # Additional `(serializer_class, check)` pairs, checked against each column on construction.
+    # Take precedence over COLUMN_SERIALIZERS, the last matching check wins.
+    EXTRA_SERIALIZERS: List[Tuple[Type[ColumnSerializer], Callable[[Any], bool]]] = []
+
+    # Maximum number of cached projections (see `project`)
+    PROJECTIONS_CACHE_SIZE = 64
+
+    # Cached properties that are reset on projections (see `project`)
+    PROJECTION_RESET_ATTRIBUTES = (
+        'row_plan',
+        '_load_plan',
+        '_mappings_plan',
+        '_changes_plan',
+        '_update_plan',
+    )
+
+    def __init__(self, model_class, nest_foreign_keys=False, compiled=False, dump_cache=None):
         """
         :param Type[DeclarativeMeta] model_class: the SQLAlchemy mapping class to be serialized
+
+        :param bool nest_foreign_keys: If True, serialize any foreign key column as a nested object.
+
+        :param bool compiled: If True, a dump function specialized for this serializer fields is
+            generated on construction and used by `dump`.
+
+        :param None|DumpCache dump_cache: If given, models dumped by `dump` and `dump_many` are
+            cached (see `DumpCache`). A cache can be shared by many serializers
         """
         self._model_class = model_class
         self._class_mapper = class_mapper(model_class)
         self._fields = self._get_declared_fields()
         self._initialize_fields(nest_foreign_keys)
+        self._plan = self._create_plan()
+        self._compiled_dump = compile_dump(self) if compiled else None
+        self._json_dump = None
+        self._projections = ProjectionCache(self.PROJECTIONS_CACHE_SIZE)
+        self._dump_cache = dump_cache
 
     @property
     def model_class(self):
@@ -60,7 +112,7 @@ class ModelSerializer(Serializer):
     def model_composites(self):
         return self.mapper.composites
 
-    @property
+    @cached_property
     def model_properties(self):
         model_properties = {}
         if self.model_columns:
@@ -73,29 +125,358 @@ class ModelSerializer(Serializer):
     def fields(self):
         return self._fields
 
-    def dump(self, model):
+    @property
+    def plan(self) -> FieldPlan:
+        return self._plan
+
+    @property
+    def compiled(self):
+        return self._compiled_dump is not None
+
+    def dump(self, model, only=None, exclude=None, context=None):
         """
         Create a serialized dict from a Declarative model
 
         :param DeclarativeMeta model: the model to be serialized
 
+        :param None|Iterable[str] only: If given, only these fields are dumped, see `project`
+
+        :param None|Iterable[str] exclude: If given, these fields are not dumped, see `project`
+
+        :param None|DumpContext context: If given, nested models are dumped with this context,
+            deduplicating repeated models (see `DumpContext`)
+
+        :rtype: dict
+        """
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump(model, context=context)
+        if context is not None:
+            return context.dump_many(self, [model])[0]
+        dump = self._compiled_dump or self._dump_model
+        if self._dump_cache is not None:
+            return self._dump_cache.dump(self, model, dump)
+        return dump(model)
+
+    def dump_many(self, models, only=None, exclude=None, context=None):
+        """
+        Create a list of serialized dicts from the given Declarative models
+
+        Equivalent to `[serializer.dump(model) for model in models]`, but fields and their
+        serializers are looked up once for all models.
+
+        :param Iterable[DeclarativeMeta] models: the models to be serialized, any iterable
+            (including a `Query`) is accepted
+
+        :param None|Iterable[str] only: If given, only these fields are dumped, see `project`
+
+        :param None|Iterable[str] exclude: If given, these fields are not dumped, see `project`
+
+        :param None|DumpContext context: If given, nested models are dumped with this context,
+            deduplicating repeated models (see `DumpContext`)
+
+        :rtype: List[dict]
+        """
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump_many(models, context=context)
+        if context is not None:
+            return context.dump_many(self, models)
+        dump = self._get_dump_function()
+        dump_cache = self._dump_cache
+        if dump_cache is not None and getattr(dump, '__self__', None) is not self:
+            # The fields are dumped without calling `dump`, which looks up the cache
+            fields_dump = dump
+
+            def dump(model):
+                return dump_cache.dump(self, model, fields_dump)
+
+        return [dump(model) for model in models]
+
+    def dump_json(self, model, only=None, exclude=None):
+        """
+        Dump a Declarative model directly as JSON encoded bytes
+
+        Same as `json.dumps(serializer.dump(model), separators=(',', ':')).encode()`, but without
+        creating the serialized dict.
+
+        :param DeclarativeMeta model: the model to be serialized
+
+        :param None|Iterable[str] only: If given, only these fields are dumped, see `project`
+
+        :param None|Iterable[str] exclude: If given, these fields are not dumped, see `project`
+
+        :rtype: bytes
+        """
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump_json(model)
+        return self._get_json_function()(model).encode()
+
+    def dump_json_many(self, models, only=None, exclude=None):
+        """
+        Dump Declarative models directly as a JSON array, encoded as bytes
+
+        :param Iterable[DeclarativeMeta] models: the models to be serialized
+
+        :param None|Iterable[str] only: If given, only these fields are dumped, see `project`
+
+        :param None|Iterable[str] exclude: If given, these fields are not dumped, see `project`
+
+        :rtype: bytes
+        """
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump_json_many(models)
+        return encode_list(models, self._get_json_function()).encode()
+
+    def dump_columns(self, models):
+        """
+        Dump Declarative models as one NumPy array for each field (requires `numpy`).
+
+        Integer, float and boolean columns are dumped as arrays of the native types, `DateTime`
+        and `Date` columns as `datetime64` arrays (timezone aware values are converted to UTC)
+        and enums as arrays of their values. Any other field is dumped as an `object` array of
+        the values returned by the field `dump`. Arrays with None values are masked arrays.
+
+        :param Iterable[DeclarativeMeta]|Query models: the models to be serialized
+
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        from .columnar import dump_columns
+        from .columnar import transpose_rows
+
+        if type(self).dump is not ModelSerializer.dump:
+            return transpose_rows([self.dump(model) for model in models])
+        return dump_columns(self, models)
+
+    def dump_stream(self, statement, session=None, batch_size=1000, json_array=False):
+        """
+        Dump the models selected by a query as encoded JSON, in chunks of `batch_size` models.
+
+        Models are fetched with `yield_per` and expunged from the session once dumped, so memory
+        usage is bounded by the batch size instead of the number of selected rows.
+
+        :param Query|Select statement: the query selecting the models to be dumped
+
+        :param None|Session session: the session used to execute the query. Optional for a
+            `Query` already bound to a session.
+
+        :param int batch_size: number of models fetched, dumped and encoded at once
+
+        :param bool json_array: If True, the chunks form a JSON array. Otherwise, each chunk has
+            one JSON object per line (NDJSON).
+
+        :rtype: Iterator[bytes]
+        """
+        if isinstance(statement, Query):
+            if session is not None:
+                statement = statement.with_session(session)
+            session = statement.session
+            models = statement.yield_per(batch_size)
+        else:
+            if session is None:
+                raise RuntimeError("Session object is required to execute a select statement")
+            result = session.execute(statement.execution_options(yield_per=batch_size))
+            models = result.scalars()
+
+        models = iter(models)
+        json_function = self._get_json_function()
+        first_chunk = True
+        if json_array:
+            yield b'['
+        while True:
+            batch = list(islice(models, batch_size))
+            if not batch:
+                break
+            yield self._encode_batch(batch, session, json_function, json_array, first_chunk)
+            first_chunk = False
+        if json_array:
+            yield b']'
+
+    async def adump_stream(self, session, statement, batch_size=1000, json_array=False):
+        """
+        Dump the models selected by a statement as encoded JSON with an `AsyncSession`, see
+        `dump_stream`:
+
+        .. code-block:: python
+
+            async for chunk in serializer.adump_stream(session, select(Employee)):
+                await send(chunk)
+
+        The models are streamed (see `AsyncSession.stream`) in partitions of `batch_size`
+        models, with the relationships dumped by the serializer loaded for each partition (see
+        `loader_options`). Each partition is dumped with the synchronous session (see
+        `AsyncSession.run_sync`), so attributes that are still not loaded are loaded without
+        failing.
+
+        :param AsyncSession session: the session used to execute the statement
+
+        :param Select statement: the statement selecting the models to be dumped
+
+        :param int batch_size: number of models fetched, dumped and encoded at once
+
+        :param bool json_array: If True, the chunks form a JSON array. Otherwise, each chunk has
+            one JSON object per line (NDJSON).
+
+        :rtype: AsyncIterator[bytes]
+        """
+        statement = statement.options(*self.loader_options())
+        result = await session.stream(statement.execution_options(yield_per=batch_size))
+        json_function = self._get_json_function()
+        first_chunk = True
+        if json_array:
+            yield b'['
+        async for batch in result.scalars().partitions(batch_size):
+            yield await session.run_sync(
+                lambda sync_session: self._encode_batch(
+                    batch, sync_session, json_function, json_array, first_chunk
+                )
+            )
+            first_chunk = False
+        if json_array:
+            yield b']'
+
+    @staticmethod
+    def _encode_batch(batch, session, json_function, json_array, first_chunk):
+        """
+        Encode a batch of models dumped by `dump_stream`, expunging the models from the session.
+
+        :rtype: bytes
+        """
+        separator = ',' if json_array else '\n'
+        encoded = separator.join(map(json_function, batch))
+        for model in batch:
+            if model in session:
+                session.expunge(model)
+        if json_array:
+            return (encoded if first_chunk else ',' + encoded).encode('utf-8')
+        return (encoded + '\n').encode('utf-8')
+
+    def _get_dump_function(self):
+        """
+        Get a function that dumps a single model, with the fields resolved beforehand.
+
+        :rtype: Callable[[DeclarativeMeta], dict]
+        """
+        if type(self).dump is not ModelSerializer.dump:
+            # `dump` customized by a subclass
+            return self.dump
+        return self._get_fields_dump_function()
+
+    def _get_fields_dump_function(self):
+        """
+        :rtype: Callable[[DeclarativeMeta], dict]
+        """
+        if self._compiled_dump is not None:
+            return self._compiled_dump
+
+        fields = tuple(
+            (spec.name, spec.field.dump, spec.model_dump) for spec in self._plan.dump_fields
+        )
+        missing = object()
+        warn = warnings.warn
+
+        def dump(model):
+            serial = {}
+            for attr, dump_field, model_dump in fields:
+                if model_dump is not None:
+                    serial[attr] = model_dump(model)
+                    continue
+                value = getattr(model, attr, missing)
+                if value is missing:
+                    warn(f"{model.__class__} does not have attribute '{attr}'")
+                    value = None
+                serial[attr] = dump_field(value)
+            return serial
+
+        return dump
+
+    def _get_json_function(self):
+        """
+        Get a function that encodes a single model as JSON.
+
+        :rtype: Callable[[DeclarativeMeta], str]
+        """
+        if type(self).dump is not ModelSerializer.dump:
+            return lambda model: encode_value(self.dump(model))
+        return self._get_fields_json_function()
+
+    def _get_fields_json_function(self):
+        """
+        :rtype: Callable[[DeclarativeMeta], str]
+        """
+        if self._json_dump is None:
+            self._json_dump = compile_json_dump(self)
+        return self._json_dump
+
+    def dump_changes(self, model):
+        """
+        Create a serialized dict with only the fields of the attributes changed since the model
+        was loaded (or last flushed), see `sqlalchemy.orm.attributes.get_history`.
+
+        Changed attributes are dumped by their fields, like in `dump`. Fields of unchanged
+        attributes are not dumped, except for the changes made inside loaded nested models (see
+        `Field.dump_changes`). Unchanged attributes are not read, so nothing is lazy loaded.
+        Fields that are not mapped attributes (like properties) are ignored, and so is a custom
+        `dump`.
+
+        :param DeclarativeMeta model: the model with changes
+
         :rtype: dict
         """
+        state = instance_state(model)
+        # Only attributes changed since loaded (or flushed) have a committed state
+        committed_state = state.committed_state
+        loaded = state.dict
+        fields, nested_fields = self._changes_plan
         serial = {}
-        for attr, field in self._fields.items():
-            if field.load_only:
+        for attr, keys, field, model_dump, nested_changes in (
+            fields if committed_state else nested_fields
+        ):
+            if committed_state and not keys.isdisjoint(committed_state):
+                if get_history(model, attr, PASSIVE_NO_INITIALIZE).has_changes():
+                    value = model_dump(model) if model_dump else field.dump(getattr(model, attr))
+                    serial[attr] = value
+                    continue
+            if nested_changes and attr in loaded:
+                changes = field.dump_changes(loaded[attr])
+                if changes is not None:
+                    serial[attr] = changes
+        return serial
+
+    @cached_property
+    def _changes_plan(self):
+        """
+        The dumped fields of mapped attributes, along with the keys of the attributes whose
+        changes are tracked (the columns of composites) and whether the field dumps changes
+        inside unchanged values (see `Field.dump_changes`). The fields of the latter are also
+        returned apart, since only those are needed for models without changes.
+
+        :rtype: Tuple[List[tuple], List[tuple]]
+        """
+        plan = []
+        for spec in self._plan.dump_fields:
+            prop = self.mapper.attrs.get(spec.name)
+            if prop is None:
+                continue
+            if isinstance(prop, CompositeProperty):
+                keys = frozenset(column_prop.key for column_prop in prop.props)
+            else:
+                keys = frozenset([prop.key])
+            nested_changes = type(spec.field).dump_changes is not Field.dump_changes
+            plan.append((spec.name, keys, spec.field, spec.model_dump, nested_changes))
+        return plan, [item for item in plan if item[-1]]
+
+    def _dump_model(self, model):
+        serial = {}
+        for spec in self._plan.dump_fields:
+            attr = spec.name
+            if spec.model_dump is not None:
+                serial[attr] = spec.model_dump(model)
                 continue
             if not hasattr(model, attr):
                 warnings.warn(f"{model.__class__} does not have attribute '{attr}'")
                 value = None
             else:
                 value = getattr(model, attr)
-            if field:
-                self._assign_default_serializer(field, attr)
-                serialized = field.dump(value)
-            else:
-                serialized = value
-            serial[attr] = serialized
+            serial[attr] = spec.field.dump(value)
         return serial
 
     def load(self, serialized, existing_model=None, session=None):
@@ -108,38 +489,440 @@ class ModelSerializer(Serializer):
 
         :param None|Session session: a SQLAlchemy session. Used only to load nested models
         """
-        from .nested_fields import SessionBasedField
-
-        prepared_attrs = {}
-        for field_name, value in serialized.items():
-            if field_name not in self._fields:
-                warnings.warn(f"Field '{field_name}' not defined for {self._model_class.__name__}")
-                continue
-            field = self._fields[field_name]
-            if field.dump_only:
-                continue
-            if field.creation_only and existing_model:
-                continue
-            self._assign_default_serializer(field, field_name)
-            if isinstance(field, SessionBasedField):
-                deserialized = field.load(value, session=session)
-            else:
-                deserialized = field.load(value)
-            prepared_attrs[field_name] = deserialized
-
         if existing_model:
+            _, attrs = self._load_plan.load(serialized, session, creating=False)
             model = existing_model
-            for key, value in prepared_attrs.items():
-                setattr(model, key, value)
         else:
-            model = self._create_model(prepared_attrs)
-            assert model is not None, "ModelSerializer._create_model cannot return None"
-            for key, value in prepared_attrs.items():
-                if key in self.model_class_parameters:
-                    continue
-                setattr(model, key, value)
+            kwargs, attrs = self._load_plan.load(serialized, session, creating=True)
+            if type(self)._create_model is ModelSerializer._create_model:
+                # The load plan already split the constructor arguments
+                model = self._construct_model(kwargs)
+            else:
+                model = self._create_model({**kwargs, **attrs})
+                assert model is not None, "ModelSerializer._create_model cannot return None"
+        for key, value in attrs.items():
+            setattr(model, key, value)
         return model
 
+    def update(self, serialized, existing_model, session=None):
+        """
+        Update a Declarative model with a serialized dict, assigning only the attributes whose
+        value changes.
+
+        Deserialized values are compared with the loaded attribute values (by the column type,
+        or by identity for related models), so a whole object sent again changes nothing and
+        nothing is flushed. Attributes that are not loaded are assigned without comparison,
+        instead of being loaded. Nested models are updated as by `load`.
+
+        :param dict serialized: the serialized object.
+
+        :param DeclarativeMeta existing_model: the model to be updated
+
+        :param None|Session session: a SQLAlchemy session. Used only to load nested models
+
+        :return: the names of the changed fields
+        :rtype: Set[str]
+        """
+        _, attrs = self._load_plan.load(serialized, session, creating=False)
+        loaded = instance_state(existing_model).dict
+        comparisons = self._update_plan
+        changed = set()
+        for key, value in attrs.items():
+            comparison = comparisons.get(key)
+            if comparison is not None:
+                keys, is_equal = comparison
+                # Only read loaded attributes, reading others would load them
+                if loaded.keys() >= keys and is_equal(getattr(existing_model, key), value):
+                    continue
+            setattr(existing_model, key, value)
+            changed.add(key)
+        return changed
+
+    @cached_property
+    def _update_plan(self):
+        """
+        The comparison of the values of each field bound to a mapped attribute, see `update`.
+
+        :rtype: Dict[str, Tuple[FrozenSet[str], Callable[[Any, Any], bool]]]
+        """
+        plan = {}
+        for spec in self._plan.fields:
+            prop = self.mapper.attrs.get(spec.name)
+            if isinstance(prop, ColumnProperty):
+                plan[spec.name] = (frozenset([prop.key]), _get_column_comparison(prop))
+            elif isinstance(prop, CompositeProperty):
+                keys = frozenset(column_prop.key for column_prop in prop.props)
+                plan[spec.name] = (keys, operator.eq)
+            elif isinstance(prop, RelationshipProperty) and prop.lazy != 'dynamic':
+                is_equal = _same_models if prop.uselist else operator.is_
+                plan[spec.name] = (frozenset([prop.key]), is_equal)
+        return plan
+
+    @cached_property
+    def _load_plan(self) -> LoadPlan:
+        return LoadPlan(self)
+
+    @cached_property
+    def row_plan(self) -> RowPlan:
+        return RowPlan(self)
+
+    def row_select(self):
+        """
+        Create a select statement of the columns dumped by this serializer, to dump rows with
+        `dump_rows` without creating model instances:
+
+        .. code-block:: python
+
+            rows = session.execute(serializer.row_select().where(Employee.company_id == 5))
+            serializer.dump_rows(rows)
+
+        Only fields bound to model columns or composites are selected (and dumped).
+
+        :rtype: Select
+        """
+        return self.row_plan.select()
+
+    def dump_row(self, row):
+        """
+        Create a serialized dict from a result row of `row_select`.
+
+        The column and composite fields are the same as dumped by `dump` for the equivalent model,
+        other fields are not included.
+
+        :param Row|RowMapping row: the row to be serialized
+
+        :rtype: dict
+        """
+        return self.row_plan.dump_row(row)
+
+    def dump_rows(self, rows):
+        """
+        :param Iterable[Row|RowMapping] rows: the rows to be serialized, see `dump_row`
+
+        :rtype: List[dict]
+        """
+        dump_row = self.row_plan.dump_row
+        return [dump_row(row) for row in rows]
+
+    def dump_parallel(self, rows, workers=None, chunk_size=10000):
+        """
+        Dump result rows of `row_select` on a pool of processes, see `dump_rows`.
+
+        Rows are sent to the worker processes as tuples, in chunks of `chunk_size` rows, along
+        with the (picklable) `RowDumper` of this serializer:
+
+        .. code-block:: python
+
+            rows = session.execute(serializer.row_select())
+            serialized = serializer.dump_parallel(rows, workers=4)
+
+        Custom field serializers must be picklable.
+
+        :param Iterable[Row|RowMapping] rows: the rows to be serialized
+
+        :param None|int workers: number of worker processes, defaults to the number of processors
+
+        :param int chunk_size: number of rows dumped at once by a worker
+
+        :rtype: List[dict]
+        """
+        row_plan = self.row_plan
+        to_tuple = row_plan.to_tuple
+        dump_rows = row_plan.dumper.dump_rows
+        rows = iter(rows)
+        chunks = iter(lambda: [to_tuple(row) for row in islice(rows, chunk_size)], [])
+        # Rows are read as chunks are dumped, keeping a few chunks for each worker
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        serialized = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in chunks:
+                if len(pending) >= max_pending:
+                    serialized.extend(pending.popleft().result())
+                pending.append(executor.submit(dump_rows, chunk))
+            while pending:
+                serialized.extend(pending.popleft().result())
+        return serialized
+
+    def loader_options(self, only=None, exclude=None):
+        """
+        Get the loader options that load everything dumped by this serializer along with the
+        models, so a whole nested dump is done in a fixed number of SQL statements:
+
+        .. code-block:: python
+
+            employees = session.query(Employee).options(*serializer.loader_options())
+            serializer.dump_many(employees)
+
+        Relationships are loaded according to the field that dumps them (see
+        `Field.get_loader_option`), columns of load-only fields are deferred and deferred
+        columns that are dumped are undeferred.
+
+        :param None|Iterable[str] only: If given, only relationships of these fields are loaded,
+            see `project`
+
+        :param None|Iterable[str] exclude: If given, relationships of these fields are not
+            loaded, see `project`
+
+        :rtype: List[LoaderOption]
+        """
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).loader_options()
+        options = []
+        model_attributes = self.mapper.attrs
+        for spec in self._plan.fields:
+            model_attribute = model_attributes.get(spec.name)
+            if isinstance(model_attribute, ColumnProperty):
+                if spec.field.load_only:
+                    if not any(column.primary_key for column in model_attribute.columns):
+                        options.append(defer(model_attribute.class_attribute))
+                elif model_attribute.deferred:
+                    options.append(undefer(model_attribute.class_attribute))
+            elif isinstance(model_attribute, RelationshipProperty) and not spec.field.load_only:
+                option = spec.field.get_loader_option(model_attribute)
+                if option is not None:
+                    options.append(option)
+        return options
+
+    def project(self, only=None, exclude=None):
+        """
+        Get a serializer that dumps only some of the fields of this serializer (a sparse
+        fieldset). Fields of nested models are selected with dotted paths:
+
+        .. code-block:: python
+
+            projection = serializer.project(only=['id', 'firstname', 'company.name'])
+            projection.dump(employee)  # {'id': 1, 'firstname': 'Jim', 'company': {'name': ...}}
+
+        Projections are cached, so getting the same projection again costs a dict lookup. Same
+        as `dump(model, only=..., exclude=...)`.
+
+        :param None|Iterable[str] only: If given, only these fields are dumped
+
+        :param None|Iterable[str] exclude: If given, these fields are not dumped
+
+        :raise ValueError: if some field is not a field of the serializer, or a dotted path goes
+            through a field that does not dump a nested model
+
+        :rtype: ModelSerializer
+        """
+        only = to_field_paths(only)
+        exclude = to_field_paths(exclude)
+        key = get_projection_key(only, exclude)
+        return self._projections.get(
+            key,
+            lambda: self._create_projection(parse_field_paths(only), parse_field_paths(exclude)),
+        )
+
+    def _get_field_names(self):
+        """
+        Names of the fields that can be selected by `project`.
+
+        :rtype: Set[str]
+        """
+        return set(self._plan.by_name)
+
+    def _create_projection(self, only, exclude, check=True):
+        """
+        :param None|Dict[str, None|List[str]] only: the selected fields, see `parse_field_paths`
+
+        :param None|Dict[str, None|List[str]] exclude: the excluded fields
+
+        :param bool check: If True, unknown field names are an error
+
+        :rtype: ModelSerializer
+        """
+        if check:
+            unknown = {*(only or ()), *(exclude or ())} - self._get_field_names()
+            if unknown:
+                raise ValueError(
+                    f"Unknown fields for {self._model_class.__name__}: {', '.join(sorted(unknown))}"
+                )
+        specs = []
+        for spec in self._plan.fields:
+            name = spec.name
+            nested_only = nested_exclude = None
+            if only is not None:
+                if name not in only:
+                    continue
+                nested_only = only[name]
+            if exclude is not None and name in exclude:
+                nested_exclude = exclude[name]
+                if nested_exclude is None:
+                    continue
+            if nested_only is not None or nested_exclude is not None:
+                nested_serializer = spec.field.serializer
+                if not isinstance(nested_serializer, ModelSerializer):
+                    raise ValueError(
+                        f"Field '{name}' of {self._model_class.__name__} has no nested fields"
+                    )
+                field = copy.copy(spec.field)
+                field._serializer = nested_serializer.project(nested_only, nested_exclude)
+                spec = spec._replace(field=field)
+            specs.append(spec)
+
+        projection = copy.copy(self)
+        # Cached properties depend on the fields
+        for attr in self.PROJECTION_RESET_ATTRIBUTES:
+            projection.__dict__.pop(attr, None)
+        projection._plan = FieldPlan.create(specs)
+        projection._fields = {spec.name: spec.field for spec in specs}
+        projection._compiled_dump = compile_dump(projection) if self.compiled else None
+        projection._json_dump = None
+        projection._projections = ProjectionCache(self.PROJECTIONS_CACHE_SIZE)
+        return projection
+
+    def load_many(self, serialized_items, session=None, mode='models'):
+        """
+        Initialize Declarative models from a list of serialized dicts
+
+        Equivalent to `[serializer.load(serialized, session=session) for serialized in
+        serialized_items]`, but existing nested models are fetched at once for all items.
+
+        With `mode='mappings'` no model is created: each item is loaded as a dict of column
+        values keyed by model attribute name, to be inserted in bulk:
+
+        .. code-block:: python
+
+            mappings = serializer.load_many(serialized_items, mode='mappings')
+            session.bulk_insert_mappings(Employee, mappings)
+
+        Mappings have only the values of column and composite fields (composites are split in
+        their columns). Other fields, such as nested models, are ignored with a warning.
+
+        :param Iterable[dict] serialized_items: the serialized objects
+
+        :param None|Session session: a SQLAlchemy session. Used only to load nested models
+
+        :param str mode: 'models' to load models or 'mappings' to load column values
+
+        :rtype: list
+        """
+        if mode == 'mappings':
+            return self._load_mappings(serialized_items)
+        elif mode != 'models':
+            raise ValueError(f"Invalid load mode: '{mode}'")
+        serialized_items = list(serialized_items)
+        # Keep the prefetched models referenced, since the session identity map is weak
+        prefetched = self._prefetch(serialized_items, session)  # noqa
+        return [self.load(serialized, session=session) for serialized in serialized_items]
+
+    @cached_property
+    def _mappings_plan(self):
+        """
+        Load function of each field loaded by `load_many` in mappings mode, along with the column
+        attribute names of composite fields (None for columns).
+
+        :rtype: Dict[str, Tuple[Callable[[Any], Any], None|Tuple[str, ...]]]
+        """
+        plan = {}
+        model_attributes = self.mapper.attrs
+        for spec in self._plan.fields:
+            if spec.field.dump_only:
+                continue
+            model_attribute = model_attributes.get(spec.name)
+            if isinstance(model_attribute, ColumnProperty):
+                plan[spec.name] = (spec.field.load, None)
+            elif isinstance(model_attribute, CompositeProperty):
+                plan[spec.name] = (
+                    spec.field.load,
+                    tuple(prop.key for prop in model_attribute.props),
+                )
+        return plan
+
+    def _load_mappings(self, serialized_items):
+        plan = self._mappings_plan
+        ignored = set()
+        mappings = []
+        for serialized in serialized_items:
+            mapping = {}
+            for field_name, value in serialized.items():
+                entry = plan.get(field_name)
+                if entry is None:
+                    if field_name not in ignored:
+                        ignored.add(field_name)
+                        self._warn_ignored_mapping_field(field_name)
+                    continue
+                load_field, composite_keys = entry
+                deserialized = load_field(value)
+                if composite_keys is None:
+                    mapping[field_name] = deserialized
+                elif deserialized is None:
+                    mapping.update(dict.fromkeys(composite_keys))
+                else:
+                    mapping.update(zip(composite_keys, deserialized.__composite_values__()))
+            mappings.append(mapping)
+        return mappings
+
+    def _warn_ignored_mapping_field(self, field_name):
+        spec = self._plan.by_name.get(field_name)
+        if spec is None:
+            warnings.warn(f"Field '{field_name}' not defined for {self._model_class.__name__}")
+        elif not spec.field.dump_only:
+            warnings.warn(
+                f"Field '{field_name}' is not a column of {self._model_class.__name__}, "
+                "ignored when loading mappings"
+            )
+
+    async def aload(self, serialized, existing_model=None, session=None):
+        """
+        Initialize a Declarative model from a serialized dict, see `load`.
+
+        Loads with the synchronous session of an `AsyncSession` (see `AsyncSession.run_sync`), so
+        the queries of nested fields are awaited without blocking the event loop. Existing models
+        of all nested fields are fetched beforehand, in one query for each field.
+
+        :param dict serialized: the serialized object.
+
+        :param None|DeclarativeMeta existing_model: If given, the model will be updated with the serialized data.
+
+        :param None|AsyncSession session: a SQLAlchemy async session. Used only to load nested
+            models
+        """
+        if session is None:
+            return self.load(serialized, existing_model)
+
+        def load(sync_session):
+            # Keep the prefetched models referenced, since the session identity map is weak
+            prefetched = self._prefetch([serialized], sync_session)  # noqa
+            return self.load(serialized, existing_model, session=sync_session)
+
+        return await session.run_sync(load)
+
+    async def aload_many(self, serialized_items, session=None):
+        """
+        Initialize Declarative models from a list of serialized dicts with an `AsyncSession`, see
+        `load_many` and `aload`.
+
+        :param Iterable[dict] serialized_items: the serialized objects
+
+        :param None|AsyncSession session: a SQLAlchemy async session. Used only to load nested
+            models
+
+        :rtype: list
+        """
+        if session is None:
+            return self.load_many(serialized_items)
+        serialized_items = list(serialized_items)
+        return await session.run_sync(
+            lambda sync_session: self.load_many(serialized_items, session=sync_session)
+        )
+
+    def _prefetch(self, serialized_items, session):
+        """
+        Fetch the existing models needed by session based fields to load the given items.
+
+        :rtype: list
+        """
+        if session is None:
+            return []
+        prefetched = []
+        for name, field in self._load_plan.session_fields:
+            values = [serialized[name] for serialized in serialized_items if name in serialized]
+            if values:
+                prefetched.append(field.prefetch(values, session))
+        return prefetched
+
     def get_model_name(self):
         """
         :rtype: str
@@ -157,6 +940,14 @@ class ModelSerializer(Serializer):
         kwargs = {
             key: value for key, value in serialized.items() if key in self.model_class_parameters
         }
+        return self._construct_model(kwargs)
+
+    def _construct_model(self, kwargs):
+        """
+        :param dict kwargs: the model constructor arguments
+
+        :rtype: DeclarativeMeta
+        """
         try:
             return self.model_class(**kwargs)
         except TypeError as e:
@@ -177,20 +968,43 @@ class ModelSerializer(Serializer):
             else:
                 self._fields.setdefault(attribute_name, Field())
 
-    def _assign_default_serializer(self, field, property_name):
+    def _create_plan(self):
         """
-        If no serializer is defined, check if the column type has some serializer
-        registered in EXTRA_SERIALIZERS.
+        Resolve the serializer of each field, so no type dispatch is done on dump or load.
 
-        :param Field field: the field to assign default serializer
+        :rtype: FieldPlan
+        """
+        model_properties = self.model_properties
+        model_attributes = self.mapper.attrs
+        specs = []
+        for field_name, field in self._fields.items():
+            model_property = model_properties.get(field_name)
+            default_serializer = None
+            if model_property is not None:
+                default_serializer = self._get_default_serializer(model_property)
+            relationship = model_attributes.get(field_name)
+            if not isinstance(relationship, RelationshipProperty):
+                relationship = None
+            specs.append(
+                create_field_spec(
+                    field_name, field, model_property, default_serializer, relationship
+                )
+            )
+        return FieldPlan.create(specs)
+
+    def _get_default_serializer(self, model_property):
+        """
+        Get the serializer used by fields without a serializer defined. Checks EXTRA_SERIALIZERS
+        first and then the column type on COLUMN_SERIALIZERS.
+
+        :param model_property: sqlalchemy column or composite on model
 
-        :param str property_name: sqlalchemy column name on model
+        :rtype: None|Serializer
         """
-        model_property = self.model_properties.get(property_name)
-        if isinstance(field.serializer, DefaultFieldSerializer) and model_property is not None:
-            for serializer_class, serializer_check in self.EXTRA_SERIALIZERS:
-                if serializer_check(model_property):
-                    field._serializer = serializer_class(model_property)
+        for serializer_class, serializer_check in reversed(self.EXTRA_SERIALIZERS):
+            if serializer_check(model_property):
+                return serializer_class(model_property)
+        return self.COLUMN_SERIALIZERS.get_serializer(model_property)
 
     @classmethod
     def _get_declared_fields(cls) -> dict:
@@ -225,3 +1039,41 @@ class ModelSerializer(Serializer):
                 return name, NestedModelField(nested_model_class)
         else:
             raise RuntimeError(f"Unexpected condition for {column_object}")
+
+
+def _get_column_comparison(prop):
+    """
+    :param ColumnProperty prop: a column attribute
+
+    :rtype: Callable[[Any, Any], bool]
+    """
+    column_type = prop.columns[0].type
+    compare_values = column_type.compare_values
+    # Types of `sqlalchemy_utils` (like `ChoiceType`) coerce assigned values on flush (or on
+    # assignment with `force_auto_coercion`), so values are compared coerced too
+    coerce = getattr(column_type, '_coerce', None)
+    if coerce is None:
+        return compare_values
+    return lambda current, value: compare_values(current, coerce(value))
+
+
+def _same_models(current, models):
+    """
+    Check if a loaded collection has the same models as a list of models.
+
+    :param Collection current: the collection of a relationship
+
+    :param Iterable models: the models to be assigned to the relationship
+
+    :rtype: bool
+    """
+    if models is None:
+        return False
+    models = list(models)
+    if len(current) != len(models):
+        return False
+    if isinstance(current, (set, frozenset)):
+        return {id(model) for model in current} == {id(model) for model in models}
+    if isinstance(current, dict):
+        return False
+    return all(model is other for model, other in zip(current, models))
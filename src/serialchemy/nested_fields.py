@@ -1,21 +1,63 @@
+from functools import lru_cache
 from warnings import warn
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.dynamic import AppenderMixin
 
+from .dump_context import get_dump_context
 from .field import Field
 from .model_serializer import ModelSerializer
 from .serializer import Serializer
 
+# Maximum number of primary keys on the `IN` clause of a single query
+PK_QUERY_CHUNK_SIZE = 500
+
 
 class SessionBasedField(Field):
     """
     Base class for fields that requires a SQLAlchemy session
     """
 
+    session_based = True
+
     def load(self, serialized, session):
         raise NotImplementedError('load method not implemented')
 
+    def prefetch(self, serialized_values, session):
+        """
+        Fetch beforehand the models needed to load many serialized values of this field, so they
+        are found in the session identity map by `load`.
+
+        :param List serialized_values: the serialized values that are going to be loaded
+
+        :param Session session: a SQLAlchemy session
+
+        :return: the fetched models, that must be kept referenced while loading the values
+        :rtype: Dict[Any, DeclarativeMeta]
+        """
+        return {}
+
+    async def aload(self, serialized, session):
+        """
+        Load the serialized value with the synchronous session of an `AsyncSession` (see
+        `AsyncSession.run_sync`), prefetching the existing models at once.
+
+        :param serialized: the serialized value
+
+        :param AsyncSession session: a SQLAlchemy async session
+        """
+
+        def load(sync_session):
+            # Keep the prefetched models referenced, since the session identity map is weak
+            prefetched = self.prefetch([serialized], sync_session)  # noqa
+            return self.load(serialized, session=sync_session)
+
+        return await session.run_sync(load)
+
 
 class PrimaryKeyField(SessionBasedField):
     """
@@ -26,17 +68,25 @@ class PrimaryKeyField(SessionBasedField):
         super().__init__(**kwargs)
         self.model_class = model_class
         self._pk_column = get_model_pk_column(self.model_class)
+        self._pk_attribute = (
+            class_mapper(model_class).get_property_by_column(self._pk_column).class_attribute
+        )
 
     def load(self, serialized, session):
-        pk_column = self._pk_column
-        query_results = session.query(self.model_class).filter(pk_column.in_(serialized)).all()
-        if len(serialized) != len(query_results):
+        pks = list(dict.fromkeys(serialized))
+        models = fetch_models_by_pk(session, self.model_class, pks)
+        missing_pks = [pk for pk in pks if pk not in models]
+        if missing_pks:
             warn(
-                "Not all primary keys found for '{}.{}'".format(
-                    self.model_class.__name__, self._pk_column
+                "Not all primary keys found for '{}.{}': {}".format(
+                    self.model_class.__name__, self._pk_column, missing_pks
                 )
             )
-        return query_results
+        return [models[pk] for pk in pks if pk in models]
+
+    def prefetch(self, serialized_values, session):
+        pks = [pk for pks in serialized_values if pks for pk in pks]
+        return fetch_models_by_pk(session, self.model_class, pks)
 
     def dump(self, value):
         def is_tomany_attribute(column):
@@ -46,12 +96,41 @@ class PrimaryKeyField(SessionBasedField):
             return isinstance(column, (list, AppenderMixin))
 
         pk_column = self._pk_column
+        if isinstance(value, AppenderMixin) and value.session is not None:
+            # Dynamic relationship, query only the primary keys instead of the whole models
+            return [pk for pk, in value.with_entities(self._pk_attribute)]
         if is_tomany_attribute(value):
             serialized = [getattr(item, pk_column.key) for item in value]
         else:
             return getattr(value, pk_column.key)
         return serialized
 
+    def get_model_dump(self, relationship):
+        if not relationship.uselist or relationship.lazy != 'select':
+            return None
+        key = relationship.key
+        class_attribute = relationship.class_attribute
+        pk_attribute = relationship.mapper.get_property_by_column(self._pk_column).class_attribute
+        order_by = relationship.order_by or ()
+
+        def dump_model(model):
+            state = inspect(model)
+            session = state.session
+            if key not in state.unloaded or session is None or state.key is None:
+                return self.dump(getattr(model, key))
+            # Collection not loaded yet, query only the primary keys instead of the whole models
+            query = session.query(pk_attribute).with_parent(model, class_attribute)
+            return [pk for pk, in query.order_by(*order_by)]
+
+        return dump_model
+
+    def get_loader_option(self, relationship):
+        loader = get_relationship_loader(relationship)
+        if loader is None:
+            return None
+        pk_property = relationship.mapper.get_property_by_column(self._pk_column)
+        return loader.load_only(pk_property.class_attribute)
+
 
 class NestedModelField(SessionBasedField):
     """
@@ -81,6 +160,29 @@ class NestedModelField(SessionBasedField):
             # No primary key, just create a new model entity
             return self.serializer.load(serialized, session=session)
 
+    def dump(self, value):
+        if value is None:
+            return None
+        context = get_dump_context()
+        if context is not None:
+            return context.dump_nested(self.serializer, value)
+        return self.serializer.dump(value)
+
+    def dump_changes(self, value):
+        if value is None:
+            return None
+        return self.serializer.dump_changes(value) or None
+
+    def prefetch(self, serialized_values, session):
+        model_class = self.serializer.model_class
+        pk_attr = get_model_pk_attr_name(model_class)
+        pks = [serialized.get(pk_attr) for serialized in serialized_values if serialized]
+        with session.no_autoflush:
+            return fetch_models_by_pk(session, model_class, [pk for pk in pks if pk])
+
+    def get_loader_option(self, relationship):
+        return get_nested_serializer_loader(relationship, self.serializer)
+
 
 class NestedModelListField(SessionBasedField):
     """
@@ -97,15 +199,24 @@ class NestedModelListField(SessionBasedField):
             return []
         class_mapper = self.serializer.model_class
         pk_attr = get_model_pk_attr_name(class_mapper)
+        pks = [item.get(pk_attr) for item in serialized]
+        existing_models = {}
+        if any(pks):
+            if session is None:
+                raise RuntimeError("Session object is required to deserialize a nested object")
+            # Fetch all existing models at once, instead of one query for each item
+            with session.no_autoflush:
+                existing_models = fetch_models_by_pk(
+                    session, class_mapper, [pk for pk in pks if pk]
+                )
         models = []
-        for item in serialized:
-            pk = item.get(pk_attr)
+        for item, pk in zip(serialized, pks):
             if pk:
                 # Serialized object has a primary key, so we load an existing model from the database
                 # instead of creating one
-                if session is None:
-                    raise RuntimeError("Session object is required to deserialize a nested object")
-                existing_model = session.query(class_mapper).get(pk)
+                existing_model = existing_models.get(pk)
+                if existing_model is None:
+                    existing_model = session.query(class_mapper).get(pk)
                 updated_model = self.serializer.load(item, existing_model, session=session)
                 models.append(updated_model)
             else:
@@ -115,7 +226,40 @@ class NestedModelListField(SessionBasedField):
         return models
 
     def dump(self, value):
-        return [self.serializer.dump(item) for item in value] if value is not None else []
+        if value is None:
+            return []
+        context = get_dump_context()
+        if context is not None:
+            return [context.dump_nested(self.serializer, item) for item in value]
+        return self.serializer.dump_many(value)
+
+    def dump_changes(self, value):
+        """
+        Dump the changes of the nested models, each one along with its primary key so it can be
+        identified on the list.
+        """
+        if not value:
+            return None
+        pk_attr = get_model_pk_attr_name(self.serializer.model_class)
+        changes = []
+        for item in value:
+            item_changes = self.serializer.dump_changes(item)
+            if item_changes:
+                # Read the primary key from the identity, an expired attribute would be loaded
+                identity = inspect(item).identity
+                pk = identity[0] if identity else getattr(item, pk_attr)
+                changes.append({pk_attr: pk, **item_changes})
+        return changes or None
+
+    def prefetch(self, serialized_values, session):
+        model_class = self.serializer.model_class
+        pk_attr = get_model_pk_attr_name(model_class)
+        pks = [item.get(pk_attr) for items in serialized_values if items for item in items]
+        with session.no_autoflush:
+            return fetch_models_by_pk(session, model_class, [pk for pk in pks if pk])
+
+    def get_loader_option(self, relationship):
+        return get_nested_serializer_loader(relationship, self.serializer)
 
 
 class NestedAttributesField(Field):
@@ -132,6 +276,16 @@ class NestedAttributesField(Field):
         serializer = NestedAttributesSerializer(attributes, many)
         super().__init__(dump_only=True, serializer=serializer)
 
+    def get_loader_option(self, relationship):
+        loader = get_relationship_loader(relationship)
+        if loader is None:
+            return None
+        attributes = [relationship.mapper.attrs.get(name) for name in self.serializer.attributes]
+        if all(isinstance(attribute, ColumnProperty) for attribute in attributes):
+            # Other attributes (like properties) may depend on any column
+            loader = loader.load_only(*[attribute.class_attribute for attribute in attributes])
+        return loader
+
 
 class NestedAttributesSerializer(Serializer):
     def __init__(self, attributes, many):
@@ -155,6 +309,112 @@ class NestedAttributesSerializer(Serializer):
         raise NotImplementedError()
 
 
+def get_relationship_loader(relationship):
+    """
+    Get the loader option that eagerly loads the given relationship: a joined load for to-one
+    relationships and a "select IN" load for collections.
+
+    :param RelationshipProperty relationship: the model relationship
+
+    :rtype: None|Load: None if the relationship can't be eagerly loaded (dynamic relationships)
+    """
+    if relationship.lazy == 'dynamic':
+        return None
+    if relationship.uselist:
+        return selectinload(relationship.class_attribute)
+    return joinedload(relationship.class_attribute)
+
+
+def get_nested_serializer_loader(relationship, serializer):
+    """
+    Get the loader option for a relationship dumped by the given serializer, including the
+    options of the serializer itself.
+
+    :param RelationshipProperty relationship: the model relationship
+
+    :param Serializer serializer: the nested serializer
+
+    :rtype: None|Load
+    """
+    loader = get_relationship_loader(relationship)
+    if loader is None or not isinstance(serializer, ModelSerializer):
+        return loader
+    options = serializer.loader_options()
+    return loader.options(*options) if options else loader
+
+
+def fetch_models_by_pk(session, model_class, pks, chunk_size=None):
+    """
+    Get the models with the given primary keys. Models are looked up in the session identity map
+    first and the remaining ones are queried in chunks.
+
+    :param Session session: a SQLAlchemy session
+
+    :param Type[DeclarativeMeta] model_class: a Declarative class
+
+    :param Iterable pks: the primary keys
+
+    :param None|int chunk_size: maximum number of primary keys in a query, defaults to
+        `PK_QUERY_CHUNK_SIZE`
+
+    :return: the models found, by the given primary keys
+    :rtype: Dict[Any, DeclarativeMeta]
+    """
+    chunk_size = chunk_size or PK_QUERY_CHUNK_SIZE
+    mapper = class_mapper(model_class)
+    pk_column = get_model_pk_column(model_class)
+    pk_attribute = mapper.get_property_by_column(pk_column)
+    convert_pk = _get_pk_converter(pk_column)
+    # Given primary keys by converted primary key
+    given_pks = {}
+    for pk in pks:
+        given_pks.setdefault(convert_pk(pk), []).append(pk)
+    models = {}
+    missing_pks = []
+    identity_map = session.identity_map
+    for pk in given_pks:
+        model = identity_map.get(mapper.identity_key_from_primary_key([pk]))
+        if model is not None and isinstance(model, model_class):
+            models[pk] = model
+        else:
+            missing_pks.append(pk)
+    for start in range(0, len(missing_pks), chunk_size):
+        chunk = missing_pks[start : start + chunk_size]
+        query = session.query(model_class).filter(pk_attribute.class_attribute.in_(chunk))
+        for model in query:
+            models[getattr(model, pk_attribute.key)] = model
+    return {given_pk: model for pk, model in models.items() for given_pk in given_pks.get(pk, ())}
+
+
+def _get_pk_converter(pk_column):
+    """
+    Get a function converting serialized primary keys to the python type of the column, as the
+    database does when querying them (like '1' to 1 for an Integer column). Only strings are
+    converted, other values and strings that can't be converted are kept.
+
+    :param Column pk_column: the primary key column
+
+    :rtype: Callable[[Any], Any]
+    """
+    try:
+        python_type = pk_column.type.python_type
+    except NotImplementedError:
+        python_type = str
+    if python_type is str:
+        return lambda pk: pk
+
+    def convert(pk):
+        if isinstance(pk, str):
+            try:
+                return python_type(pk)
+            except (TypeError, ValueError):
+                pass
+        return pk
+
+    return convert
+
+
+@lru_cache(maxsize=256)
 def get_model_pk_attr_name(model_class):
     """
     Get the primary key attribute name from a Declarative model class
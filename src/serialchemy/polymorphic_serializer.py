@@ -1,5 +1,8 @@
 import enum
+from functools import cached_property
+
 from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import selectin_polymorphic
 
 from serialchemy import ModelSerializer
 
@@ -34,18 +37,51 @@ class PolymorphicModelSerializer(ModelSerializer):
     from different classes (but have a common base)
     """
 
-    def __init__(self, declarative_class):
-        super().__init__(declarative_class)
+    def __init__(self, declarative_class, compiled=False, dump_cache=None):
+        super().__init__(declarative_class, compiled=compiled, dump_cache=dump_cache)
+        # Functions dumping models of each class, see `_get_class_dump_function`
+        self._class_dump_functions = {}
         # maped = class_mapper(declarative_class)
         if has_sqlalchemy_polymorphic_decendants(declarative_class):
             self.is_polymorphic = True
-            self.sub_serializers = self._get_sub_serializers(declarative_class)
             self.identity_key = _get_identity_key(declarative_class)
         else:
             self.is_polymorphic = False
 
+    @cached_property
+    def class_serializers(self):
+        """
+        The serializer of each subclass of the model class, used to dispatch models by their
+        concrete class.
+
+        Created on first use, so sub serializers (that are never used to dispatch) don't create
+        their own serializers of subclasses.
+
+        :rtype: Dict[type, ModelSerializer]
+        """
+        if not self.is_polymorphic:
+            return {}
+        return self._get_sub_serializers(self.model_class, compiled=self.compiled)
+
+    @cached_property
+    def sub_serializers(self):
+        """
+        The serializer of each subclass of the model class, by polymorphic identity.
+
+        :rtype: Dict[Any, ModelSerializer]
+        """
+        return {
+            _get_identity(sub_cls): serializer
+            for sub_cls, serializer in self.class_serializers.items()
+        }
+
     @classmethod
-    def _get_sub_serializers(cls, declarative_class):
+    def _get_sub_serializers(cls, declarative_class, compiled=False):
+        """
+        Create a serializer for each subclass of the given class.
+
+        :rtype: Dict[type, ModelSerializer]
+        """
 
         serializers_sub_class_map = {
             sub_cls.get_identity(): sub_cls
@@ -54,16 +90,17 @@ class PolymorphicModelSerializer(ModelSerializer):
         }
 
         def get_subclasses(declarative_class):
-            """Recursively finds all subclasses of the current class"""
-            subclasses = declarative_class.__subclasses__()
-            for s in subclasses:
-                subclasses.extend(get_subclasses(s))
+            """Recursively finds all subclasses of the current class, without duplicates"""
+            subclasses = {}
+            for subclass in declarative_class.__subclasses__():
+                subclasses[subclass] = None
+                subclasses.update(get_subclasses(subclass))
             return subclasses
 
+        # Serializer subclasses may not accept the `compiled` argument
+        kwargs = {'compiled': True} if compiled else {}
         return {
-            _get_identity(sub_cls): serializers_sub_class_map.get(_get_identity(sub_cls), cls)(
-                sub_cls
-            )
+            sub_cls: serializers_sub_class_map.get(_get_identity(sub_cls), cls)(sub_cls, **kwargs)
             for sub_cls in get_subclasses(declarative_class)
         }
 
@@ -80,9 +117,165 @@ class PolymorphicModelSerializer(ModelSerializer):
                 )
         return super().load(serialized, existing_model, session)
 
-    def dump(self, model):
+    def update(self, serialized, existing_model, session=None):
         if self.is_polymorphic:
-            model_identity = _get_identity(model.__class__)
-            if model_identity in self.sub_serializers:
-                return self.sub_serializers[model_identity].dump(model)
+            serializer = self._get_class_serializer(existing_model.__class__)
+            if serializer is not self:
+                return serializer.update(serialized, existing_model, session)
+        return super().update(serialized, existing_model, session)
+
+    def load_many(self, serialized_items, session=None, mode='models'):
+        """
+        Initialize Declarative models from a list of serialized dicts, see
+        `ModelSerializer.load_many`.
+
+        Items are grouped by polymorphic identity and each group is loaded at once by the
+        serializer of its class. Models are returned in the order of the serialized items.
+        """
+        if not self.is_polymorphic:
+            return super().load_many(serialized_items, session=session, mode=mode)
+
+        serialized_items = list(serialized_items)
+        groups = {}
+        for index, serialized in enumerate(serialized_items):
+            model_identity = serialized.get(self.identity_key)
+            serializer = self.sub_serializers.get(model_identity, self) if model_identity else self
+            groups.setdefault(serializer, []).append(index)
+
+        loaded = [None] * len(serialized_items)
+        for serializer, indexes in groups.items():
+            group = [serialized_items[index] for index in indexes]
+            if serializer is self:
+                group_loaded = super().load_many(group, session=session, mode=mode)
+            else:
+                group_loaded = serializer.load_many(group, session=session, mode=mode)
+            for index, model in zip(indexes, group_loaded):
+                loaded[index] = model
+        return loaded
+
+    def _get_dump_function(self):
+        if self.is_polymorphic or type(self).dump is not PolymorphicModelSerializer.dump:
+            return self.dump
+        return self._get_fields_dump_function()
+
+    def _get_json_function(self):
+        if not self.is_polymorphic or type(self).dump is not PolymorphicModelSerializer.dump:
+            return super()._get_json_function()
+
+        json_functions = {}
+
+        def dump_json(model):
+            model_class = model.__class__
+            json_function = json_functions.get(model_class)
+            if json_function is None:
+                serializer = self._get_class_serializer(model_class)
+                if type(serializer).dump is PolymorphicModelSerializer.dump:
+                    json_function = serializer._get_fields_json_function()
+                else:
+                    json_function = serializer._get_json_function()
+                json_functions[model_class] = json_function
+            return json_function(model)
+
+        return dump_json
+
+    def dump(self, model, only=None, exclude=None, context=None):
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump(model, context=context)
+        if context is not None:
+            return context.dump_many(self, [model])[0]
+        if self.is_polymorphic:
+            dump = self._class_dump_functions.get(model.__class__)
+            if dump is None:
+                dump = self._get_class_dump_function(model.__class__)
+            if self._dump_cache is not None:
+                return self._dump_cache.dump(self, model, dump)
+            return dump(model)
         return super().dump(model)
+
+    def dump_many(self, models, only=None, exclude=None, context=None):
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump_many(models, context=context)
+        if context is not None:
+            return context.dump_many(self, models)
+        if (
+            not self.is_polymorphic
+            or type(self).dump is not PolymorphicModelSerializer.dump
+            or self._dump_cache is not None
+        ):
+            return super().dump_many(models)
+
+        dump_functions = self._class_dump_functions
+        get_class_dump_function = self._get_class_dump_function
+        serialized = []
+        for model in models:
+            dump = dump_functions.get(model.__class__)
+            if dump is None:
+                dump = get_class_dump_function(model.__class__)
+            serialized.append(dump(model))
+        return serialized
+
+    def dump_changes(self, model):
+        if self.is_polymorphic:
+            serializer = self._get_class_serializer(model.__class__)
+            if serializer is not self:
+                return serializer.dump_changes(model)
+        return super().dump_changes(model)
+
+    def _get_class_dump_function(self, model_class):
+        """
+        Get the function dumping models of the given class with the fields of its serializer,
+        without dispatching the model again.
+
+        :rtype: Callable[[object], dict]
+        """
+        serializer = self._get_class_serializer(model_class)
+        if serializer is self or type(serializer).dump is PolymorphicModelSerializer.dump:
+            dump = serializer._get_fields_dump_function()
+        else:
+            dump = serializer.dump
+        self._class_dump_functions[model_class] = dump
+        return dump
+
+    def loader_options(self, only=None, exclude=None):
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).loader_options()
+        options = super().loader_options()
+        if self.is_polymorphic:
+            descendants = [
+                mapper.class_
+                for mapper in self.mapper.self_and_descendants
+                if mapper is not self.mapper
+            ]
+            options.append(selectin_polymorphic(self.model_class, descendants))
+        return options
+
+    def _get_field_names(self):
+        # Fields of subclasses can be selected too
+        names = super()._get_field_names()
+        for serializer in self.class_serializers.values():
+            names.update(serializer._get_field_names())
+        return names
+
+    def _create_projection(self, only, exclude, check=True):
+        projection = super()._create_projection(only, exclude, check=check)
+        projection._class_dump_functions = {}
+        if self.is_polymorphic:
+            projection.__dict__.pop('sub_serializers', None)
+            projection.__dict__['class_serializers'] = {
+                sub_cls: serializer._create_projection(only, exclude, check=False)
+                for sub_cls, serializer in self.class_serializers.items()
+            }
+        return projection
+
+    def _get_class_serializer(self, model_class):
+        """
+        Get the serializer whose fields are used to dump models of the given class. Sub
+        serializers are created for every subclass, so they don't dispatch `model_class` again.
+
+        :rtype: PolymorphicModelSerializer
+        """
+        serializer = self.class_serializers.get(model_class)
+        if serializer is None:
+            # The model class itself or a class defined after the serializers were created
+            serializer = self.sub_serializers.get(_get_identity(model_class), self)
+        return serializer
@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+
+
+def parse_field_paths(paths):
+    """
+    Group dotted field paths by their first field name.
+
+    >>> parse_field_paths(['id', 'company.name', 'company.location'])
+    {'id': None, 'company': ['name', 'location']}
+
+    A field is mapped to None when it is selected as a whole, which takes precedence over its
+    nested paths.
+
+    :param None|str|Iterable[str] paths: the field paths
+
+    :rtype: None|Dict[str, None|List[str]]
+    """
+    if paths is None:
+        return None
+    if isinstance(paths, str):
+        paths = [paths]
+    fields = {}
+    for path in paths:
+        name, _, nested_path = path.partition('.')
+        if not nested_path:
+            fields[name] = None
+        elif name not in fields:
+            fields[name] = [nested_path]
+        elif fields[name] is not None:
+            fields[name].append(nested_path)
+    return fields
+
+
+def to_field_paths(paths):
+    """
+    Collect field paths in a tuple, so one-shot iterables (like generators) can be read again.
+
+    :param None|str|Iterable[str] paths: the field paths
+
+    :rtype: None|Tuple[str, ...]
+    """
+    if paths is None:
+        return None
+    if isinstance(paths, str):
+        return (paths,)
+    return tuple(paths)
+
+
+def get_projection_key(only, exclude):
+    """
+    :rtype: Tuple[None|FrozenSet[str], None|FrozenSet[str]]
+    """
+
+    def freeze(paths):
+        if paths is None:
+            return None
+        return frozenset([paths] if isinstance(paths, str) else paths)
+
+    return freeze(only), freeze(exclude)
+
+
+class ProjectionCache(object):
+    """
+    Thread-safe LRU cache of the projections of a serializer, by `get_projection_key`.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._projections = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create_projection):
+        """
+        Get a cached projection, calling `create_projection` on a cache miss.
+
+        :param tuple key: the projection key
+
+        :param Callable[[], ModelSerializer] create_projection: creates the projection
+
+        :rtype: ModelSerializer
+        """
+        with self._lock:
+            projection = self._projections.get(key)
+            if projection is not None:
+                self._projections.move_to_end(key)
+                return projection
+
+        projection = create_projection()
+        with self._lock:
+            projection = self._projections.setdefault(key, projection)
+            self._projections.move_to_end(key)
+            while len(self._projections) > self.maxsize:
+                self._projections.popitem(last=False)
+        return projection
+
+    def __len__(self):
+        return len(self._projections)
@@ -0,0 +1,166 @@
+from collections.abc import Mapping
+from enum import Enum
+
+from sqlalchemy import select
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm import CompositeProperty
+
+from .datetime_serializer import DateTimeSerializer
+from .enum_serializer import EnumKeySerializer
+from .enum_serializer import EnumSerializer
+from .field import DefaultFieldSerializer
+from .field import Field
+
+
+class RowPlan(object):
+    """
+    Dump plan of a `ModelSerializer` that works on result rows instead of model instances.
+
+    Only fields bound to model columns or composites are part of the plan: the select statement
+    has one labeled column for each column field and one for each column of composite fields.
+    """
+
+    def __init__(self, serializer):
+        """
+        :param ModelSerializer serializer: the serializer whose field plan is used
+        """
+        columns = []
+        fields = []
+        model_class = serializer.model_class
+        model_attributes = serializer.mapper.attrs
+        for spec in serializer.plan.dump_fields:
+            model_attribute = model_attributes.get(spec.name)
+            if isinstance(model_attribute, ColumnProperty):
+                indexes = (len(columns),)
+                # Attributes of the model class (not of the class that maps the column) keep the
+                # filter of single table inheritance subclasses
+                columns.append(getattr(model_class, model_attribute.key).label(spec.name))
+                composite_class = None
+            elif isinstance(model_attribute, CompositeProperty):
+                indexes = tuple(range(len(columns), len(columns) + len(model_attribute.props)))
+                columns.extend(
+                    getattr(model_class, prop.key).label(f'{spec.name}__{prop.key}')
+                    for prop in model_attribute.props
+                )
+                composite_class = model_attribute.composite_class
+            else:
+                continue
+            fields.append((spec.name, indexes, composite_class, _get_row_dump(spec)))
+        self.columns = tuple(columns)
+        self.keys = tuple(column.key for column in columns)
+        self.fields = tuple(fields)
+        self.dumper = RowDumper(self.fields)
+
+    @property
+    def field_names(self):
+        return tuple(name for name, _indexes, _composite_class, _dump in self.fields)
+
+    def select(self):
+        """
+        :rtype: Select
+        """
+        return select(*self.columns)
+
+    def dump_row(self, row):
+        """
+        :param Row|RowMapping row: a row selected by `select` (or with the same columns)
+
+        :rtype: dict
+        """
+        if isinstance(row, Mapping):
+            row = [row[key] for key in self.keys]
+        return self.dumper.dump_row(row)
+
+    def to_tuple(self, row):
+        """
+        :param Row|RowMapping row: a row selected by `select` (or with the same columns)
+
+        :rtype: tuple
+        """
+        if isinstance(row, Mapping):
+            return tuple(row[key] for key in self.keys)
+        return tuple(row)
+
+
+class RowDumper(object):
+    """
+    The part of a `RowPlan` that dumps rows, independent of SQLAlchemy.
+
+    Dumps plain sequences of column values (in the order of `RowPlan.columns`). Can be pickled,
+    as long as the custom field serializers can be, to dump rows on other processes.
+    """
+
+    def __init__(self, fields):
+        """
+        :param Tuple[Tuple[str, Tuple[int, ...], None|type, None|Callable], ...] fields: name,
+            column indexes, composite class and dump function (None if values are dumped
+            unchanged) of each field
+        """
+        self.fields = fields
+
+    def dump_row(self, row):
+        """
+        :param Sequence row: the column values
+
+        :rtype: dict
+        """
+        serial = {}
+        for name, indexes, composite_class, dump in self.fields:
+            if composite_class is None:
+                value = row[indexes[0]]
+            else:
+                value = composite_class(*[row[index] for index in indexes])
+            serial[name] = value if dump is None else dump(value)
+        return serial
+
+    def dump_rows(self, rows):
+        """
+        :param Iterable[Sequence] rows: the column values of each row
+
+        :rtype: List[dict]
+        """
+        dump_row = self.dump_row
+        return [dump_row(row) for row in rows]
+
+
+def _get_row_dump(spec):
+    """
+    Get the function dumping the values of a field. The dump of the most common serializers is
+    replaced by module functions, so no SQLAlchemy object is pickled along with the function.
+
+    :param FieldSpec spec: the field
+
+    :rtype: None|Callable[[Any], Any]
+    """
+    if spec.identity:
+        return None
+    field = spec.field
+    if type(field).dump is not Field.dump:
+        return field.dump
+    serializer_class = type(field.serializer)
+    dump_implementation = getattr(serializer_class.dump, '__func__', serializer_class.dump)
+    if serializer_class is DefaultFieldSerializer:
+        return dump_default
+    elif dump_implementation is DateTimeSerializer.dump.__func__:
+        return dump_isoformat
+    elif dump_implementation is EnumSerializer.dump:
+        return dump_enum_value
+    elif dump_implementation is EnumKeySerializer.dump:
+        return dump_enum_name
+    return field.dump
+
+
+def dump_default(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def dump_isoformat(value):
+    return None if value is None else value.isoformat()
+
+
+def dump_enum_value(value):
+    return value.value if value else None
+
+
+def dump_enum_name(value):
+    return value.name if value else None
@@ -10,6 +10,26 @@ class Serializer(ABC):
     def load(self, serialized, **kw):
         pass
 
+    def dump_many(self, values):
+        """
+        Serialize each of the given values.
+
+        :param Iterable values: the values to be serialized
+
+        :rtype: list
+        """
+        return [self.dump(value) for value in values]
+
+    def load_many(self, serialized_values, **kw):
+        """
+        Deserialize each of the given values.
+
+        :param Iterable serialized_values: the serialized values
+
+        :rtype: list
+        """
+        return [self.load(serialized, **kw) for serialized in serialized_values]
+
 
 class ColumnSerializer(Serializer):
     def __init__(self, column):
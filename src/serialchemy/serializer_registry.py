@@ -0,0 +1,88 @@
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Enum
+from sqlalchemy.types import TypeDecorator
+
+from .datetime_serializer import DateColumnSerializer
+from .datetime_serializer import DateTimeColumnSerializer
+from .enum_serializer import EnumSerializer
+from .serializer_checks import is_date_column
+from .serializer_checks import is_datetime_column
+from .serializer_checks import is_enum_column
+
+
+class ColumnSerializerRegistry(object):
+    """
+    Map SQLAlchemy column types to the `ColumnSerializer` used by default on columns of that type.
+
+    Serializers are looked up by the class of the column type and its base classes, then by the
+    classes of the type implementation for `TypeDecorator` types: the serializer of the first
+    registered class is used, so a serializer registered for `Enum` is also used for
+    `postgresql.ENUM` columns.
+    """
+
+    def __init__(self):
+        self._serializers = {}
+
+    def register(self, type_class, serializer_class, check=None):
+        """
+        :param Type[TypeEngine] type_class: the SQLAlchemy column type class
+
+        :param Type[ColumnSerializer] serializer_class: serializer to be used on columns of
+            `type_class` type. Created with the column as the only argument.
+
+        :param None|Callable[[Column], bool] check: optional additional check for the column
+        """
+        self._serializers[type_class] = (serializer_class, check)
+
+    def unregister(self, type_class):
+        self._serializers.pop(type_class, None)
+
+    def copy(self):
+        """
+        :rtype: ColumnSerializerRegistry
+        """
+        registry = ColumnSerializerRegistry()
+        registry._serializers.update(self._serializers)
+        return registry
+
+    def get_serializer(self, column):
+        """
+        Create the serializer registered for the column type.
+
+        :param Column column: the model column
+
+        :rtype: None|ColumnSerializer
+        """
+        if not isinstance(column, Column):
+            return None
+        column_type = column.type
+        entry = self._lookup(type(column_type))
+        if entry is None and isinstance(column_type, TypeDecorator):
+            entry = self._lookup(type(column_type.impl))
+        if entry is None:
+            return None
+        serializer_class, check = entry
+        if check is not None and not check(column):
+            return None
+        return serializer_class(column)
+
+    def _lookup(self, type_class):
+        for base_class in type_class.__mro__:
+            entry = self._serializers.get(base_class)
+            if entry is not None:
+                return entry
+        return None
+
+
+def create_default_registry():
+    """
+    :rtype: ColumnSerializerRegistry
+    """
+    registry = ColumnSerializerRegistry()
+    # Subclasses of the date types and decorators of `Date` are not converted by default
+    registry.register(DateTime, DateTimeColumnSerializer, check=is_datetime_column)
+    registry.register(Date, DateColumnSerializer, check=is_date_column)
+    registry.register(Enum, EnumSerializer, check=is_enum_column)
+    return registry